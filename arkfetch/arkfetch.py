@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
-import platform
 import os
-import socket
-import psutil
 import subprocess
 import re
 import sys
 import argparse
+import json
+import shutil
 from datetime import datetime
+from functools import lru_cache
 
 # --- ANSI Color Definitions ---
 ANSI_COLORS = {
@@ -86,369 +86,670 @@ BOX_CHARS = {
     "tree_corner": "└", # For "└ └"
 }
 
-# --- System Information Gathering ---
-def get_system_info():
-    info = {}
-
-    # OS and Kernel
-    info['OS'] = platform.system()
-    if info['OS'] == 'Linux':
-        try:
-            lsb_release_output = subprocess.check_output(['lsb_release', '-sd'], 
-universal_newlines=True).strip()
-            info['OS'] = f"{lsb_release_output} {platform.machine()}"
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            info['OS'] = f"{info['OS']} {platform.version().split('-')[0].strip()} {platform.machine()}" # Fallback
-    elif info['OS'] == 'Windows':
-        info['OS'] = f"Windows {platform.version()}" # More generic Windows version
-
-    info['Kernel'] = platform.release()
-
-    # Hostname
-    info['Hostname'] = socket.gethostname()
-
-    # Uptime
-    if info['OS'].startswith('Linux'):
-        try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-                
-                total_seconds_int = int(uptime_seconds)
-                days = total_seconds_int // (24 * 3600)
-                remaining_seconds = total_seconds_int % (24 * 3600)
-                hours = remaining_seconds // 3600
-                remaining_seconds %= 3600
-                minutes = remaining_seconds // 60
-
-                info['Uptime'] = f"{int(days)}d {int(hours)}h {int(minutes)}m"
-        except FileNotFoundError:
-            info['Uptime'] = 'N/A'
-    elif info['OS'].startswith('Windows'):
-        try:
-            output = subprocess.check_output('systeminfo | find "Boot Time"', shell=True, universal_newlines=True).strip()
-            match = re.search(r'Boot Time:\s*(.+)', output)
-            if match:
-                boot_time_str = match.group(1).strip()
-                try:
-                    boot_dt = datetime.strptime(boot_time_str, '%m/%d/%Y, %I:%M:%S %p')
-                except ValueError:
-                    try:
-                        boot_dt = datetime.strptime(boot_time_str, '%d/%m/%Y, %H:%M:%S')
-                    except ValueError:
-                        boot_dt = None
-
-                if boot_dt:
-                    current_dt = datetime.now()
-                    uptime_delta = current_dt - boot_dt
-                    total_seconds = int(uptime_delta.total_seconds())
-
-                    days = total_seconds // (24 * 3600)
-                    remaining_seconds = total_seconds % (24 * 3600)
-                    hours = remaining_seconds // 3600
-                    remaining_seconds %= 3600
-                    minutes = remaining_seconds // 60
-
-                    info['Uptime'] = f"{int(days)}d {int(hours)}h {int(minutes)}m"
-                else:
-                    info['Uptime'] = f"Since {boot_time_str} (parse error)"
-            else:
-                info['Uptime'] = 'N/A'
-        except Exception as e:
-            info['Uptime'] = f'N/A ({e})'
+# --- Precompiled Patterns ---
+ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+LSPCI_GPU_RE = re.compile(rb'(?:VGA compatible controller|3D controller):\s*(.*)')
+GPU_NAME_CLEANUP_RE = re.compile(r'\s*\(rev [0-9a-f]+\)|@\s*[\d\.]+\s*GHz|\[Integrated\]')
+WMCTRL_NAME_RE = re.compile(r'Name: (.+)')
+DISPLAY_MANAGER_RE = re.compile(r'Loaded: loaded \(.*display-manager\.service;\nenabled;.*\)\n\s+Active: active \(running\)\s+since (.*)')
+CPU_NAME_RE = re.compile(r'^(.*?)\s+@') # CPU model without the "@ x.xxGHz" suffix
 
-    # Current Date and Time
-    info['CurrentDateTime'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# --- System Information Gathering ---
+# External tools are bounded by this timeout so a single hung probe cannot stall the fetch.
+PROBE_TIMEOUT = 2 # seconds
+PROBE_ERRORS = (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired)
+
+@lru_cache(maxsize=None)
+def have_command(name):
+    """Checks whether an executable is on PATH, remembering the answer."""
+    return shutil.which(name) is not None
+
+def run_probe(cmd, timeout=PROBE_TIMEOUT, text=True, **kwargs):
+    """Run an external tool and return its stdout as text (or bytes with text=False)."""
+    # Fail fast for tools that aren't installed instead of paying for a fork + exec
+    if not have_command(cmd[0]):
+        raise FileNotFoundError(f"{cmd[0]} not found")
+    return subprocess.run(cmd, capture_output=True, text=text, check=True, timeout=timeout, **kwargs).stdout
+
+# Each probe wraps one slow, independent lookup and returns a (key, value) pair.
+# A value of None means "leave the key unset".
+def format_uptime(total_seconds):
+    days = total_seconds // (24 * 3600)
+    remaining_seconds = total_seconds % (24 * 3600)
+    hours = remaining_seconds // 3600
+    remaining_seconds %= 3600
+    minutes = remaining_seconds // 60
+    return f"{int(days)}d {int(hours)}h {int(minutes)}m"
+
+def probe_os_linux():
+    import platform
+    # /etc/os-release carries the same PRETTY_NAME lsb_release prints, without starting a Python script
+    try:
+        with open('/etc/os-release', 'r', encoding='utf-8') as f:
+            os_release = dict(line.strip().split('=', 1) for line in f if '=' in line)
+        pretty_name = os_release.get('PRETTY_NAME', '').strip('"\'')
+        if pretty_name:
+            return 'OS', f"{pretty_name} {platform.machine()}"
+    except OSError:
+        pass
+    return 'OS', f"Linux {platform.version().split('-')[0].strip()} {platform.machine()}" # Fallback
+
+DRM_CLASS_DIR = '/sys/class/drm'
+PCI_IDS_FILES = ['/usr/share/hwdata/pci.ids', '/usr/share/misc/pci.ids', '/usr/share/pci.ids']
+# Used when no pci.ids database is installed
+PCI_VENDOR_NAMES = {
+    '1002': 'Advanced Micro Devices, Inc. [AMD/ATI]',
+    '10de': 'NVIDIA Corporation',
+    '8086': 'Intel Corporation',
+    '1af4': 'Red Hat, Inc.',
+    '15ad': 'VMware',
+    '1234': 'QEMU',
+    '1a03': 'ASPEED Technology, Inc.',
+}
 
-    # CPU
-    info['CPU'] = platform.processor()
-    if info['OS'].startswith('Linux'):
+def lookup_pci_name(vendor_id, device_id):
+    """Looks up "Vendor Device" in pci.ids, stopping as soon as the vendor block ends."""
+    for ids_file in PCI_IDS_FILES:
         try:
-            with open('/proc/cpuinfo', 'r') as f:
+            with open(ids_file, 'r', encoding='utf-8', errors='replace') as f:
+                vendor_name = None
                 for line in f:
-                    if 'model name' in line:
-                        info['CPU'] = line.split(':')[-1].strip()
+                    if vendor_name is None:
+                        if line.startswith(vendor_id + '  '):
+                            vendor_name = line[len(vendor_id):].strip()
+                    elif line.startswith('\t' + device_id + '  '):
+                        return f"{vendor_name} {line[len(device_id) + 1:].strip()}"
+                    elif line[:1] not in ('\t', '#', '\n'): # Next vendor: the device isn't listed
                         break
-        except FileNotFoundError:
-            pass
-
-    # GPU
-    if info['OS'].startswith('Linux'):
-        gpu_names = []
-        try:
-            lspci_output = subprocess.check_output(['lspci', '-k'], universal_newlines=True, stderr=subprocess.PIPE)
-        except subprocess.CalledProcessError as e:
-            if "Operation not permitted" in e.stderr or "Permission denied" in e.stderr:
-                try:
-                    lspci_output = subprocess.check_output(['sudo', 'lspci', '-k'], universal_newlines=True)
-                except (FileNotFoundError, subprocess.CalledProcessError):
-                    lspci_output = ""
-            else:
-                lspci_output = ""
-        except FileNotFoundError:
-            lspci_output = ""
-
-        if lspci_output:
-            for line in lspci_output.splitlines():
-                match = re.search(r'(?:VGA compatible controller|3D controller):\s*(.*)', line)
-                if match:
-                    raw_gpu_name = match.group(1).strip()
-                    # Clean up Linux GPU names: remove (rev xx), @ frequency, [Integrated], etc.
-                    clean_gpu_name = re.sub(r'\s*\(rev [0-9a-f]+\)|@\s*[\d\.]+\s*GHz|\[Integrated\]', '', raw_gpu_name).strip()
-                    gpu_names.append(clean_gpu_name)
-            if gpu_names:
-                info['GPU'] = gpu_names # Store as list to handle multiple lines
-            else:
-                info['GPU'] = 'N/A (No compatible GPU found by lspci)'
-        else:
-            info['GPU'] = 'N/A (Install pciutils or run script with sudo)'
-    elif info['OS'].startswith('Windows'):
-        try:
-            wmic_output = subprocess.check_output(['wmic', 'path', 'win32_videocontroller', 'get', 'name'], universal_newlines=True)
-            gpu_names = [line.strip() for line in wmic_output.splitlines() if line.strip() and "Name" not in line]
-            if gpu_names:
-                info['GPU'] = gpu_names # Store as list to handle multiple lines
-            else:
-                info['GPU'] = 'N/A'
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            info['GPU'] = 'N/A (Check Device Manager)'
-
-
-    # Memory
-    mem = psutil.virtual_memory()
-    total_gb = mem.total / (1024**3)
-    available_gb = mem.available / (1024**3)
-    info['Memory'] = f"{available_gb:.2f} GiB / {total_gb:.2f} GiB ({mem.percent}%)"
-
-    # Disk Usage (Root partition for Linux, C: drive for Windows)
-    if info['OS'].startswith('Linux'):
+            if vendor_name:
+                return f"{vendor_name} Device {device_id}"
+        except OSError:
+            continue
+    return None
+
+def probe_gpu_drm():
+    """Lists GPUs from /sys/class/drm, which avoids running lspci over the whole PCI bus."""
+    gpu_names = []
+    seen_devices = set()
+    try:
+        card_names = sorted(name for name in os.listdir(DRM_CLASS_DIR) if name[:4] == 'card' and name[4:].isdigit())
+    except OSError:
+        return gpu_names
+    for card_name in card_names:
+        device_dir = os.path.join(DRM_CLASS_DIR, card_name, 'device')
         try:
-            disk_usage = psutil.disk_usage('/')
-            total_disk_gb = disk_usage.total / (1024**3)
-            used_disk_gb = disk_usage.used / (1024**3)
-            fs_type = 'Unknown'
+            device_path = os.path.realpath(device_dir)
+            if device_path in seen_devices:
+                continue
+            seen_devices.add(device_path)
+            with open(os.path.join(device_dir, 'vendor'), 'r') as f:
+                vendor_id = f.read().strip().lower().removeprefix('0x')
+            with open(os.path.join(device_dir, 'device'), 'r') as f:
+                device_id = f.read().strip().lower().removeprefix('0x')
+        except OSError: # Not a PCI device (e.g. an SoC display engine)
+            continue
+        gpu_name = lookup_pci_name(vendor_id, device_id)
+        if not gpu_name:
             try:
-                mount_output = subprocess.check_output(['df', '-T', '/'], universal_newlines=True).strip().split('\n')
-                if len(mount_output) > 1:
-                    fs_type = mount_output[1].split()[1]
-            except Exception:
-                pass
-            info['Disk'] = f"{used_disk_gb:.2f} GiB / {total_disk_gb:.2f} GiB ({disk_usage.percent}%) - {fs_type}"
-        except Exception:
-            info['Disk'] = 'N/A'
-    elif info['OS'].startswith('Windows'):
-        try:
-            disk_usage = psutil.disk_usage('C:\\')
-            total_disk_gb = disk_usage.total / (1024**3)
-            used_disk_gb = disk_usage.used / (1024**3)
-            info['Disk'] = f"{used_disk_gb:.2f} GiB / {total_disk_gb:.2f} GiB ({disk_usage.percent}%) (C:)"
-        except Exception:
-            info['Disk'] = 'N/A'
-            
-    # Resolution (Linux only for now, can be expanded for Windows)
-    if info['OS'].startswith('Linux'):
-        try:
-            xrandr_output = subprocess.check_output(['xrandr'], universal_newlines=True)
-            # Regex to find connected primary displays and their resolutions
-            match = re.search(r'(\S+ (?:connected|primary) (?:.+ )?\s*(\d+x\d+)\+?.*?)(?=\n\S+ disconnected|\n\s*\S+ connected|$)', xrandr_output, re.MULTILINE)
-            if match:
-                # Get the full display line and resolution
-                display_info = match.group(1).strip()
-                resolution = match.group(2)
-                # Clean up display_info to be concise (e.g., "DP-1 2560x1440")
-                display_name_match = re.match(r'^(\S+)', display_info) 
-                display_name = display_name_match.group(1) if display_name_match else "Unknown"
-                info['Resolution'] = f"{display_name}: {resolution}"
-            else:
-                info['Resolution'] = 'N/A (No active display found)'
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            info['Resolution'] = 'N/A (xrandr not found or X not running)'
-    else:
-        info['Resolution'] = 'N/A' # Not implemented for Windows
-
-    # Shell
-    info['Shell'] = os.environ.get('SHELL', 'N/A')
-    if info['OS'].startswith('Windows'):
-        info['Shell'] = os.environ.get('ComSpec', 'N/A')
-        if 'powershell' in info['Shell'].lower():
-            info['Shell'] = 'PowerShell'
-        elif 'cmd.exe' in info['Shell'].lower():
-            info['Shell'] = 'CMD'
-        else:
-            info['Shell'] = 'Unknown Windows Shell'
-
-    # Terminal
-    info['Terminal'] = os.environ.get('TERM', 'N/A')
-    if info['OS'].startswith('Windows'):
-        if 'WT_SESSION' in os.environ:
-            info['Terminal'] = 'Windows Terminal'
-        elif 'ConEmuPID' in os.environ:
-            info['Terminal'] = 'ConEmu'
-        elif 'MSYSTEM' in os.environ:
-            info['Terminal'] = 'Msys/Cygwin Terminal'
+                driver = os.path.basename(os.readlink(os.path.join(device_dir, 'driver')))
+            except OSError:
+                driver = 'no driver'
+            gpu_name = f"{PCI_VENDOR_NAMES.get(vendor_id, 'Unknown vendor')} [{vendor_id}:{device_id}] ({driver})"
+        gpu_names.append(GPU_NAME_CLEANUP_RE.sub('', gpu_name).strip())
+    return gpu_names
+
+def probe_gpu_linux():
+    gpu_names = probe_gpu_drm()
+    if gpu_names:
+        return 'GPU', gpu_names # Store as list to handle multiple lines
+    try:
+        # Raw bytes: only the matched GPU names get decoded
+        lspci_output = run_probe(['lspci', '-k'], text=False)
+    except subprocess.CalledProcessError as e:
+        if b"Operation not permitted" in e.stderr or b"Permission denied" in e.stderr:
+            try:
+                lspci_output = run_probe(['sudo', 'lspci', '-k'], text=False)
+            except PROBE_ERRORS:
+                lspci_output = b""
         else:
-            info['Terminal'] = 'Unknown Windows Terminal'
-
-    # Window Manager / Desktop Environment (Linux only)
-    if info['OS'].startswith('Linux'):
-        info['WM'] = 'N/A'
-        info['DE'] = 'N/A'
+            lspci_output = b""
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        lspci_output = b""
+
+    if not lspci_output:
+        return 'GPU', 'N/A (Install pciutils or run script with sudo)'
+
+    # One scan over the whole buffer; (.*) stops at the end of each line
+    for match in LSPCI_GPU_RE.finditer(lspci_output):
+        raw_gpu_name = match.group(1).strip().decode('utf-8', 'replace')
+        # Clean up Linux GPU names: remove (rev xx), @ frequency, [Integrated], etc.
+        clean_gpu_name = GPU_NAME_CLEANUP_RE.sub('', raw_gpu_name).strip()
+        gpu_names.append(clean_gpu_name)
+    if gpu_names:
+        return 'GPU', gpu_names # Store as list to handle multiple lines
+    return 'GPU', 'N/A (No compatible GPU found by lspci)'
+
+# Registry class key holding one subkey per installed display adapter
+DISPLAY_ADAPTER_CLASS_KEY = r'SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}'
+WINDOWS_VERSION_KEY = r'SOFTWARE\Microsoft\Windows NT\CurrentVersion'
+
+def probe_gpu_windows():
+    # Read adapter names from the registry instead of launching the deprecated wmic
+    try:
+        import winreg
+        gpu_names = []
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, DISPLAY_ADAPTER_CLASS_KEY) as class_key:
+            index = 0
+            while True:
+                try:
+                    adapter_name = winreg.EnumKey(class_key, index)
+                except OSError: # No more subkeys
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(class_key, adapter_name) as adapter_key:
+                        driver_desc = winreg.QueryValueEx(adapter_key, 'DriverDesc')[0]
+                except OSError: # Non-adapter subkeys such as "Properties" are not readable
+                    continue
+                if driver_desc and driver_desc not in gpu_names:
+                    gpu_names.append(driver_desc)
+        if gpu_names:
+            return 'GPU', gpu_names # Store as list to handle multiple lines
+        return 'GPU', 'N/A'
+    except (ImportError, OSError):
+        return 'GPU', 'N/A (Check Device Manager)'
+
+def get_fs_type(mount_point):
+    """Look up the filesystem type of a mount point in /proc/self/mounts."""
+    fs_type = 'Unknown'
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                # Later entries are stacked on top of earlier ones, so the last match wins
+                if len(fields) > 2 and fields[1] == mount_point:
+                    fs_type = fields[2]
+    except OSError:
+        pass
+    return fs_type
 
-        if os.environ.get('XDG_CURRENT_DESKTOP'):
-            info['DE'] = os.environ.get('XDG_CURRENT_DESKTOP')
-            info['WM'] = info['DE']
-        elif os.environ.get('DESKTOP_SESSION'):
-            session = os.environ.get('DESKTOP_SESSION')
-            info['DE'] = session
-            info['WM'] = session 
-        elif os.environ.get('XDG_SESSION_DESKTOP'):
-            info['DE'] = os.environ.get('XDG_SESSION_DESKTOP')
-            info['WM'] = info['DE']
+def probe_disk_linux():
+    try:
+        # Same arithmetic as psutil.disk_usage, straight from one statvfs call
+        st = os.statvfs('/')
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        percent = round(used / (used + free) * 100, 1) if used + free else 0.0
+        total_disk_gb = total / (1024**3)
+        used_disk_gb = used / (1024**3)
+        fs_type = get_fs_type('/')
+        return 'Disk', f"{used_disk_gb:.2f} GiB / {total_disk_gb:.2f} GiB ({percent}%) - {fs_type}"
+    except Exception:
+        return 'Disk', 'N/A'
+
+def read_meminfo():
+    """Return (total, available) memory in bytes from /proc/meminfo, or None if unavailable."""
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            meminfo = f.read(2048)
+    except OSError:
+        return None
+
+    def read_kb(key):
+        i = meminfo.find(key)
+        if i < 0:
+            return None
+        j = meminfo.find(b'\n', i)
+        return int(meminfo[i + len(key):j if j >= 0 else None].split()[0]) * 1024
+
+    total = read_kb(b'MemTotal:')
+    available = read_kb(b'MemAvailable:')
+    if not total or available is None:
+        return None
+    return total, available
+
+def probe_resolution_linux():
+    try:
+        # --current reports the server's cached state instead of re-probing every output
+        xrandr_output = run_probe(['xrandr', '--current'])
+        for line in xrandr_output.splitlines():
+            if ' connected' not in line:
+                continue
+            # e.g. "DP-1 connected primary 2560x1440+0+0 (normal left ...) 597mm x 336mm"
+            fields = line.split()
+            for field in fields[2:]:
+                width, _, rest = field.partition('x')
+                height = rest.split('+', 1)[0]
+                if width.isdigit() and height.isdigit():
+                    return 'Resolution', f"{fields[0]}: {width}x{height}"
+        return 'Resolution', 'N/A (No active display found)'
+    except PROBE_ERRORS:
+        return 'Resolution', 'N/A (xrandr not found or X not running)'
+
+# Pretty names for WM values as reported by wmctrl or the session environment
+WM_DISPLAY_NAMES = {
+    'gnome-shell': 'GNOME Shell',
+    'kde': 'KDE Plasma',
+    'xfce': 'XFCE',
+    'cinnamon': 'Cinnamon',
+    'mate': 'MATE',
+    'lxde': 'LXDE',
+    'budgie': 'Budgie',
+    'pantheon': 'Pantheon',
+}
 
+def probe_wm_linux():
+    try:
+        wmctrl_output = run_probe(['wmctrl', '-m'])
+        match = WMCTRL_NAME_RE.search(wmctrl_output)
+        if match:
+            return 'WM', match.group(1).strip()
+    except PROBE_ERRORS:
+        pass
+    return 'WM', None
+
+DPKG_STATUS_FILE = '/var/lib/dpkg/status'
+FLATPAK_APP_DIRS = ['/var/lib/flatpak/app', os.path.expanduser('~/.local/share/flatpak/app')]
+
+def count_dpkg_packages():
+    """Count installed dpkg packages straight from the status database."""
+    try:
+        with open(DPKG_STATUS_FILE, 'rb') as f:
+            data = f.read()
+        return data.count(b'\nPackage: ') + (1 if data.startswith(b'Package: ') else 0)
+    except OSError: # Missing or unreadable; let dpkg itself answer
+        return run_probe(['dpkg', '-l']).count('\n') - 5 # Subtract header/footer
+
+def count_flatpak_apps():
+    """Count installed flatpak apps from their install directories."""
+    app_dirs = [path for path in FLATPAK_APP_DIRS if os.path.isdir(path)]
+    if app_dirs:
         try:
-            wmctrl_output = subprocess.check_output(['wmctrl', '-m'], universal_newlines=True, stderr=subprocess.PIPE)
-            match = re.search(r'Name: (.+)', wmctrl_output)
-            if match:
-                wm_name = match.group(1).strip()
-                if info['WM'] == 'N/A' or info['WM'].lower() != wm_name.lower():
-                    info['WM'] = wm_name
-            if info['DE'] == 'N/A' and info['WM'] and info['WM'].lower() in ['gnome-shell', 'mutter', 'kwin_x11', 'xfwm4', 'cinnamon', 'openbox', 'awesome', 'i3']:
-                info['DE'] = info['WM'].replace('-shell', '').replace('_x11', '').replace('mutter', 'GNOME').capitalize()
-
-        except (FileNotFoundError, subprocess.CalledProcessError):
+            return sum(len(os.listdir(path)) for path in app_dirs)
+        except OSError: # e.g. PermissionError; fall back to asking flatpak
             pass
+    return len(run_probe(['flatpak', 'list', '--app']).splitlines()) - 1 # Subtract header
 
-        if info['WM'].lower() == 'gnome-shell': info['WM'] = 'GNOME Shell'
-        elif info['WM'].lower() == 'kde': info['WM'] = 'KDE Plasma'
-        elif info['WM'].lower() == 'xfce': info['WM'] = 'XFCE'
-        elif info['WM'].lower() == 'cinnamon': info['WM'] = 'Cinnamon'
-        elif info['WM'].lower() == 'mate': info['WM'] = 'MATE'
-        elif info['WM'].lower() == 'lxde': info['WM'] = 'LXDE'
-        elif info['WM'].lower() == 'budgie': info['WM'] = 'Budgie'
-        elif info['WM'].lower() == 'pantheon': info['WM'] = 'Pantheon'
-
-    else:
-        info['WM'] = 'N/A'
-        info['DE'] = 'N/A'
-
-
-    # Placeholder for Packages, Display Manager, Theme
-    info['Packages'] = 'N/A' 
+def probe_packages():
     try:
         # Example for Debian/Ubuntu based systems (dpkg)
-        dpkg_count = subprocess.check_output(['dpkg', '-l'], universal_newlines=True).count('\n') - 5 # Subtract header/footer
-        info['Packages'] = f"{dpkg_count} (dpkg)"
+        packages = f"{count_dpkg_packages()} (dpkg)"
         # Try to get flatpak count
         try:
-            flatpak_count = len(subprocess.check_output(['flatpak', 'list', '--app'], universal_newlines=True).splitlines()) - 1 # Subtract header
-            info['Packages'] += f", {flatpak_count} (flatpak)"
-        except (FileNotFoundError, subprocess.CalledProcessError):
+            packages += f", {count_flatpak_apps()} (flatpak)"
+        except PROBE_ERRORS:
             pass
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        pass # Keep N/A if dpkg not found
+        return 'Packages', packages
+    except PROBE_ERRORS:
+        return 'Packages', 'N/A' # Keep N/A if dpkg not found
 
+def probe_display_manager_linux():
+    try:
+        dm_output = run_probe(['systemctl', 'status', 'display-manager.service'])
+        match = DISPLAY_MANAGER_RE.search(dm_output)
+        if match:
+            # Parse the output to find common DMs
+            if 'gdm' in dm_output: return 'LM', 'GDM'
+            elif 'sddm' in dm_output: return 'LM', 'SDDM'
+            elif 'lightdm' in dm_output: return 'LM', 'LightDM'
+            elif 'lxdm' in dm_output: return 'LM', 'LXDM'
+            elif 'mdm' in dm_output: return 'LM', 'MDM'
+            else: return 'LM', 'Running (Unknown DM)'
+        return 'LM', None
+    except PROBE_ERRORS:
+        return 'LM', 'N/A'
+
+def probe_theme_linux(de):
+    # Theme - very difficult to get universally, often DE-specific
+    # Mapping to 'Theme' for wmtheme in Fastfetch
+    if 'GNOME' in de:
+        try: # GTK Theme
+            return 'Theme', run_probe(['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme']).strip().replace("'", "")
+        except PROBE_ERRORS:
+            pass
+    elif 'KDE' in de:
+        try: # Plasma Theme
+            kf5_config = run_probe(['kf5-config', '--path', 'data', 'kdeglobals']).strip().split(':')
+            for path in kf5_config:
+                if os.path.exists(os.path.join(path, 'kdeglobals')):
+                    with open(os.path.join(path, 'kdeglobals'), 'r') as f:
+                        for line in f:
+                            if 'ColorScheme=' in line:
+                                return 'Theme', line.split('=')[1].strip()
+        except PROBE_ERRORS:
+            pass
+    elif 'XFCE' in de:
+        try: # XFCE GTK Theme
+            return 'Theme', run_probe(['xfconf-query', '-c', 'xsettings', '-p', '/Net/ThemeName']).strip()
+        except PROBE_ERRORS:
+            pass
+    elif 'Cinnamon' in de: # Mint's theme
+        try:
+            return 'Theme', run_probe(['dconf', 'read', '/org/cinnamon/theme/name']).strip().replace("'", "")
+        except PROBE_ERRORS:
+            pass
+    return 'Theme', 'N/A' # Default if no specific DE theme found
 
-    # Simple check for common DMs (Linux) - mapping to 'LM' for fastfetch compatibility
-    if info['OS'].startswith('Linux'):
-        if 'DISPLAY_MANAGER' in os.environ:
-            info['LM'] = os.environ.get('DISPLAY_MANAGER')
-        elif 'XDG_SESSION_TYPE' in os.environ and os.environ['XDG_SESSION_TYPE'] == 'wayland':
-            info['LM'] = 'Wayland'
-        else: # Try systemd-related methods
-            try:
-                dm_output = subprocess.check_output('systemctl status display-manager.service', shell=True, universal_newlines=True, stderr=subprocess.PIPE)
-                match = re.search(r'Loaded: loaded \(.*display-manager\.service;\nenabled;.*\)\n\s+Active: active \(running\)\s+since (.*)', dm_output)
-                if match:
-                    # Parse the output to find common DMs
-                    if 'gdm' in dm_output: info['LM'] = 'GDM'
-                    elif 'sddm' in dm_output: info['LM'] = 'SDDM'
-                    elif 'lightdm' in dm_output: info['LM'] = 'LightDM'
-                    elif 'lxdm' in dm_output: info['LM'] = 'LXDM'
-                    elif 'mdm' in dm_output: info['LM'] = 'MDM'
-                    else: info['LM'] = 'Running (Unknown DM)'
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                info['LM'] = 'N/A'
-    else:
-        info['LM'] = 'N/A'
+STATX_BTIME = 0x800 # Request bit for the birth time field
+STATX_BTIME_OFFSET = 80 # Offset of stx_btime.tv_sec in struct statx
+AT_FDCWD = -100
 
+def read_birth_time(path):
+    """Returns a file's birth time via statx(2), or None if statx can't be called."""
+    birth_time = getattr(os.stat(path), 'st_birthtime', None) # Python 3.12+
+    if birth_time is not None:
+        return int(birth_time)
+    try:
+        import ctypes
+        import struct
+        libc = ctypes.CDLL(None, use_errno=True)
+        statx_buf = ctypes.create_string_buffer(256) # sizeof(struct statx)
+        if libc.statx(AT_FDCWD, os.fsencode(path), 0, STATX_BTIME, statx_buf) != 0:
+            return None
+        stx_mask = struct.unpack_from('I', statx_buf, 0)[0]
+        if not stx_mask & STATX_BTIME: # Filesystem doesn't record birth times; stat %W prints 0 too
+            return 0
+        return struct.unpack_from('q', statx_buf, STATX_BTIME_OFFSET)[0]
+    except (OSError, AttributeError): # No libc handle or a glibc without statx
+        return None
+
+def probe_install_time_linux():
+    try:
+        # Get birth time of the root directory
+        birth_time = read_birth_time('/')
+        if birth_time is not None:
+            return 'OS Install Timestamp', birth_time
+        return 'OS Install Timestamp', int(run_probe(['stat', '-c', '%W', '/']).strip())
+    except (ValueError, OSError) + PROBE_ERRORS:
+        return 'OS Age', 'N/A (Could not determine OS age)'
+
+def probe_install_time_windows():
+    try:
+        import winreg
+        # InstallDate is stored as a Unix timestamp
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, WINDOWS_VERSION_KEY, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as key:
+            return 'OS Install Timestamp', int(winreg.QueryValueEx(key, 'InstallDate')[0])
+    except (ImportError, OSError, ValueError) as e:
+        return 'OS Age', f'N/A ({e})'
+
+# --- Static Info Cache ---
+# Values that only change on reinstall/upgrade are kept between runs so their probes can be skipped.
+CACHE_VERSION = 2
+CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'arkfetch', 'static.json')
+CACHED_KEYS = ['OS', 'CPU', 'GPU', 'OS Install Timestamp']
+# Hardware can change without an OS update (e.g. a GPU swap), so entries also expire
+CACHE_MAX_AGE = 7 * 86400 # seconds
+
+def platform_fingerprint():
+    """Release plus full version, so Windows feature updates (release stays "10"/"11") also invalidate."""
+    import platform
+    return [platform.release(), platform.version()]
+
+def load_cache():
+    """
+    Load cached static info as (entries, saved_at). Entries are empty when the cache
+    is missing, from another cache version or OS build, or older than CACHE_MAX_AGE.
+    """
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+    if (not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION
+            or cache.get('Platform') != platform_fingerprint()
+            or not isinstance(cache.get('Saved At'), (int, float))
+            or datetime.now().timestamp() - cache['Saved At'] > CACHE_MAX_AGE):
+        return {}, None
+    return {key: cache[key] for key in CACHED_KEYS if key in cache}, cache['Saved At']
+
+def save_cache(cache, saved_at=None):
+    """
+    Persist static info; saved_at keeps the original age when adding to a still-valid
+    cache. Failures are ignored since the cache is only an optimization.
+    """
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'Platform': platform_fingerprint(),
+                       'Saved At': saved_at or int(datetime.now().timestamp()), **cache}, f)
+    except OSError:
+        pass
 
-    # Theme - very difficult to get universally, often DE-specific
-    # Mapping to 'Theme' for wmtheme in Fastfetch
-    if info['OS'].startswith('Linux') and info['DE'] != 'N/A':
-        if 'GNOME' in info['DE']:
-            try: # GTK Theme
-                gtk_theme = subprocess.check_output(['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'], universal_newlines=True).strip().replace("'", "")
-                info['Theme'] = gtk_theme
-            except (FileNotFoundError, subprocess.CalledProcessError):
-                pass
-        elif 'KDE' in info['DE']:
-            try: # Plasma Theme
-                kf5_config = subprocess.check_output(['kf5-config', '--path', 'data', 'kdeglobals'], universal_newlines=True).strip().split(':')
-                for path in kf5_config:
-                    if os.path.exists(os.path.join(path, 'kdeglobals')):
-                        with open(os.path.join(path, 'kdeglobals'), 'r') as f:
-                            for line in f:
-                                if 'ColorScheme=' in line:
-                                    info['Theme'] = line.split('=')[1].strip()
-                                    break
-                        if info['Theme'] != 'N/A': break
-            except (FileNotFoundError, subprocess.CalledProcessError):
-                pass
-        elif 'XFCE' in info['DE']:
-            try: # XFCE GTK Theme
-                xfconf_output = subprocess.check_output(['xfconf-query', '-c', 'xsettings', '-p', '/Net/ThemeName'], universal_newlines=True).strip()
-                info['Theme'] = xfconf_output
-            except (FileNotFoundError, subprocess.CalledProcessError):
-                pass
-        elif 'Cinnamon' in info['DE']: # Mint's theme
+def get_system_info():
+    # Deferred so that --help and argument errors don't pay for these imports
+    import platform
+    import concurrent.futures
+
+    info = {}
+    # One snapshot of the environment for every lookup below. Windows stores
+    # the keys upper-cased, so Windows-only names are spelled that way.
+    env = dict(os.environ)
+
+    # Gate on the platform itself: info['OS'] is replaced by the distro name below
+    system = platform.system()
+    is_linux = system == 'Linux'
+    is_windows = system == 'Windows'
+
+    # Slow probes (subprocesses) run concurrently so the fetch costs roughly
+    # the slowest probe instead of the sum of all of them.
+    cache, cache_saved_at = load_cache()
+
+    probes = [probe_packages]
+    if is_linux:
+        probes += [probe_disk_linux, probe_resolution_linux, probe_wm_linux]
+        if 'OS' not in cache:
+            probes.append(probe_os_linux)
+        if 'GPU' not in cache:
+            probes.append(probe_gpu_linux)
+        if 'OS Install Timestamp' not in cache:
+            probes.append(probe_install_time_linux)
+        env_lm = 'DISPLAY_MANAGER' in env or env.get('XDG_SESSION_TYPE') == 'wayland'
+        if not env_lm:
+            probes.append(probe_display_manager_linux)
+    elif is_windows:
+        if 'GPU' not in cache:
+            probes.append(probe_gpu_windows)
+        if 'OS Install Timestamp' not in cache:
+            probes.append(probe_install_time_windows)
+
+    # One worker per probe so none of them queues behind a slow one
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = [executor.submit(probe) for probe in probes]
+
+        # OS and Kernel
+        info['OS'] = system
+        if is_windows:
+            info['OS'] = f"Windows {platform.version()}" # More generic Windows version
+
+        info['Kernel'] = platform.release()
+
+        # Hostname
+        info['Hostname'] = None
+        if is_linux:
             try:
-                cinnamon_theme = subprocess.check_output(['dconf', 'read', '/org/cinnamon/theme/name'], universal_newlines=True).strip().replace("'", "")
-                info['Theme'] = cinnamon_theme
-            except (FileNotFoundError, subprocess.CalledProcessError):
+                with open('/proc/sys/kernel/hostname', 'r') as f:
+                    info['Hostname'] = f.read().strip()
+            except OSError:
                 pass
+        if not info['Hostname']:
+            import socket
+            info['Hostname'] = socket.gethostname()
 
-    if 'Theme' not in info or info['Theme'] == 'N/A':
-        info['Theme'] = 'N/A' # Default if no specific DE theme found
-
-    # OS Install Age
-    info['OS Age'] = 'N/A'
-    if info['OS'].startswith('Linux'):
-        try:
-            # Get inode change time of root directory
-            birth_install_timestamp = int(subprocess.check_output(['stat', '-c', '%W', '/'], universal_newlines=True).strip())
-            current_timestamp = int(datetime.now().timestamp())
-            time_progression = current_timestamp - birth_install_timestamp
-            days_difference = time_progression // 86400
-            info['OS Age'] = f"{days_difference} days"
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            info['OS Age'] = 'N/A (Could not determine OS age)'
-    elif info['OS'].startswith('Windows'):
-        try:
-            # For Windows, we can approximate by the creation date of C:\Windows
-            output = subprocess.check_output('powershell -command "(Get-ItemProperty C:\\Windows).CreationTime"', shell=True, universal_newlines=True).strip()
-            creation_time_str = output
+        # Uptime
+        if is_linux:
             try:
-                creation_dt = datetime.strptime(creation_time_str, '%A, %B %d, %Y %I:%M:%S %p')
-            except ValueError: # Try another common format
+                # procfs files are slurped with one unbuffered read and parsed as bytes
+                fd = os.open('/proc/uptime', os.O_RDONLY)
                 try:
-                    creation_dt = datetime.strptime(creation_time_str, '%m/%d/%Y %I:%M:%S %p')
-                except ValueError:
-                    creation_dt = None
-            
-            if creation_dt:
-                current_dt = datetime.now()
-                age_delta = current_dt - creation_dt
-                days_difference = age_delta.days
-                info['OS Age'] = f"{days_difference} days"
+                    uptime_seconds = float(os.read(fd, 64).split(None, 1)[0])
+                finally:
+                    os.close(fd)
+                info['Uptime'] = format_uptime(int(uptime_seconds))
+            except (OSError, ValueError, IndexError):
+                info['Uptime'] = 'N/A'
+        elif is_windows:
+            try:
+                import ctypes
+                get_tick_count = ctypes.windll.kernel32.GetTickCount64 # Milliseconds since boot
+                get_tick_count.restype = ctypes.c_ulonglong
+                info['Uptime'] = format_uptime(get_tick_count() // 1000)
+            except Exception as e:
+                info['Uptime'] = f'N/A ({e})'
+
+        # Current Date and Time
+        info['CurrentDateTime'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # CPU (platform.processor() runs `uname -p` on Linux, so Linux relies on /proc/cpuinfo alone)
+        if 'CPU' not in cache:
+            if is_linux:
+                cpu_name = 'N/A'
+                try:
+                    with open('/proc/cpuinfo', 'rb', buffering=0) as f:
+                        buf = f.read(8192) # The first CPU's block is enough
+                    i = buf.find(b'model name')
+                    if i >= 0:
+                        j = buf.find(b':', i)
+                        k = buf.find(b'\n', j)
+                        cpu_name = buf[j + 1:k if k >= 0 else None].strip().decode(errors='replace')
+                except OSError:
+                    pass
             else:
-                info['OS Age'] = 'N/A (Failed to parse Windows install date)'
-        except Exception as e:
-            info['OS Age'] = f'N/A ({e})'
+                cpu_name = platform.processor()
+            info['CPU'] = cpu_name or 'N/A'
+
+        # Memory (psutil is only imported where /proc/meminfo is not available)
+        meminfo = read_meminfo() if is_linux else None
+        if meminfo:
+            total, available = meminfo
+            mem_percent = round((total - available) / total * 100, 1)
+        else:
+            try:
+                import psutil
+                mem = psutil.virtual_memory()
+                total, available, mem_percent = mem.total, mem.available, mem.percent
+            except ImportError:
+                total = None
+        if total:
+            total_gb = total / (1024**3)
+            available_gb = available / (1024**3)
+            info['Memory'] = f"{available_gb:.2f} GiB / {total_gb:.2f} GiB ({mem_percent}%)"
+        else:
+            info['Memory'] = 'N/A'
 
-    # Username
-    try:
-        info['User'] = os.getlogin()
-    except OSError:
-        info['User'] = os.environ.get('USER') or os.environ.get('USERNAME', 'N/A')
+        # Disk Usage (Root partition for Linux, C: drive for Windows)
+        if is_windows:
+            try:
+                import psutil
+                disk_usage = psutil.disk_usage('C:\\')
+                total_disk_gb = disk_usage.total / (1024**3)
+                used_disk_gb = disk_usage.used / (1024**3)
+                info['Disk'] = f"{used_disk_gb:.2f} GiB / {total_disk_gb:.2f} GiB ({disk_usage.percent}%) (C:)"
+            except Exception:
+                info['Disk'] = 'N/A'
+
+        # Resolution (Linux goes through the xrandr probe)
+        if is_windows:
+            try:
+                import ctypes
+                user32 = ctypes.windll.user32
+                user32.SetProcessDPIAware() # Report physical pixels rather than DPI-scaled ones
+                width, height = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1) # SM_CXSCREEN, SM_CYSCREEN
+                info['Resolution'] = f"Primary: {width}x{height}" if width and height else 'N/A'
+            except Exception:
+                info['Resolution'] = 'N/A'
+        elif not is_linux:
+            info['Resolution'] = 'N/A' # Not implemented for this platform
+
+        # Shell
+        info['Shell'] = env.get('SHELL', 'N/A')
+        if is_windows:
+            info['Shell'] = env.get('COMSPEC', 'N/A')
+            if 'powershell' in info['Shell'].lower():
+                info['Shell'] = 'PowerShell'
+            elif 'cmd.exe' in info['Shell'].lower():
+                info['Shell'] = 'CMD'
+            else:
+                info['Shell'] = 'Unknown Windows Shell'
+
+        # Terminal
+        info['Terminal'] = env.get('TERM', 'N/A')
+        if is_windows:
+            if 'WT_SESSION' in env:
+                info['Terminal'] = 'Windows Terminal'
+            elif 'CONEMUPID' in env:
+                info['Terminal'] = 'ConEmu'
+            elif 'MSYSTEM' in env:
+                info['Terminal'] = 'Msys/Cygwin Terminal'
+            else:
+                info['Terminal'] = 'Unknown Windows Terminal'
+
+        # Window Manager / Desktop Environment (Linux only)
+        info['WM'] = 'N/A'
+        info['DE'] = 'N/A'
+        if is_linux:
+            if env.get('XDG_CURRENT_DESKTOP'):
+                info['DE'] = env.get('XDG_CURRENT_DESKTOP')
+                info['WM'] = info['DE']
+            elif env.get('DESKTOP_SESSION'):
+                session = env.get('DESKTOP_SESSION')
+                info['DE'] = session
+                info['WM'] = session 
+            elif env.get('XDG_SESSION_DESKTOP'):
+                info['DE'] = env.get('XDG_SESSION_DESKTOP')
+                info['WM'] = info['DE']
+
+        # Simple check for common DMs (Linux) - mapping to 'LM' for fastfetch compatibility
+        info['LM'] = 'N/A'
+        if is_linux:
+            if 'DISPLAY_MANAGER' in env:
+                info['LM'] = env.get('DISPLAY_MANAGER')
+            elif env.get('XDG_SESSION_TYPE') == 'wayland':
+                info['LM'] = 'Wayland'
+
+        # Username
+        try:
+            info['User'] = os.getlogin()
+        except OSError:
+            info['User'] = env.get('USER') or env.get('USERNAME', 'N/A')
+
+        info['OS Age'] = 'N/A'
+
+        info.update(cache)
+
+        # Join the probes as they finish
+        for future in concurrent.futures.as_completed(futures):
+            key, value = future.result()
+            if value is not None:
+                info[key] = value
+
+    # Second wave: everything below depends on the WM reported by wmctrl
+    if is_linux:
+        if info['DE'] == 'N/A' and info['WM'] and info['WM'].lower() in ['gnome-shell', 'mutter', 'kwin_x11', 'xfwm4', 'cinnamon', 'openbox', 'awesome', 'i3']:
+            info['DE'] = info['WM'].replace('-shell', '').replace('_x11', '').replace('mutter', 'GNOME').capitalize()
+
+        info['WM'] = WM_DISPLAY_NAMES.get(info['WM'].lower(), info['WM'])
+
+    info['Theme'] = 'N/A'
+    if is_linux and info['DE'] != 'N/A':
+        info['Theme'] = probe_theme_linux(info['DE'])[1]
+
+    # OS Install Age is recomputed from the (possibly cached) install timestamp
+    install_timestamp = info.pop('OS Install Timestamp', None)
+    if install_timestamp is not None:
+        days_difference = (int(datetime.now().timestamp()) - install_timestamp) // 86400
+        info['OS Age'] = f"{days_difference} days"
+
+    # Only cache successful lookups so a later run can still pick up e.g. a newly installed lspci
+    # The Windows OS string is built in-process from platform.version(), so it is never cached
+    fresh_keys = ['OS', 'CPU'] if is_linux else ['CPU']
+    fresh = {key: info[key] for key in fresh_keys if info.get(key) not in (None, '', 'N/A') and key not in cache}
+    if isinstance(info.get('GPU'), list) and 'GPU' not in cache:
+        fresh['GPU'] = info['GPU']
+    if install_timestamp is not None and 'OS Install Timestamp' not in cache:
+        fresh['OS Install Timestamp'] = install_timestamp
+    if fresh:
+        save_cache({**cache, **fresh}, cache_saved_at)
 
     return info
 
@@ -492,7 +793,7 @@ def load_ascii_art(file_path=None):
         art_lines = lines_from_file[4:] # NEW: Start art content from line 5 (index 4)
 
         if art_lines:
-            max_len = max(len(line) for line in art_lines)
+            max_len = max(map(len, art_lines))
             art_lines = [line.ljust(max_len) for line in art_lines]
         else:
             art_lines = default_ascii_art
@@ -525,56 +826,65 @@ def load_ascii_art(file_path=None):
     
     return ascii_art_color_code, text_color_code, art_lines, footer_message, selected_theme_from_file
 
+# The splotch bar never changes, so it is built once at import time
+COLOR_SPLOTCHES = " ".join(
+    ANSI_COLORS[color_name] + "   " + ANSI_COLORS["reset"]
+    for color_name in ("bg_black", "bg_red", "bg_green", "bg_yellow", "bg_blue", "bg_magenta", "bg_cyan", "bg_white")
+)
+
 def generate_color_splotches():
-    """Generates a string of 8 standard terminal color blocks."""
-    splotches = ""
-    colors = ["bg_black", "bg_red", "bg_green", "bg_yellow", "bg_blue", "bg_magenta", "bg_cyan", "bg_white"]
-    for color_name in colors:
-        splotches += ANSI_COLORS.get(color_name, "") + "   " + ANSI_COLORS["reset"] + " "
-    return splotches.strip()
+    """Returns a string of 8 standard terminal color blocks."""
+    return COLOR_SPLOTCHES
 
+@lru_cache(maxsize=512)
 def get_display_width(text_with_ansi):
     """Calculates the display width of a string, ignoring ANSI escape codes."""
-    return len(re.sub(r'\x1b\[[0-9;]*m', '', text_with_ansi))
+    return len(ANSI_ESCAPE_RE.sub('', text_with_ansi))
+
+# --- Theme 2 key alignment ---
+# List of all potential items that might be displayed 
+# in Theme 2 (for consistent key alignment)
+# Using the structure from Fastfetch config to determine max width
+THEME2_KEY_PREFIXES = [
+    ("PC", " PC"),
+    ("CPU", "│ ├"),
+    ("GPU", "│ ├󰍛"), # Note: Fastfetch uses 󰍛 for GPU, which is a memory icon.
+    ("Memory", "│ ├󰍛"),
+    ("Disk", "└ └"),
+    ("OS", " OS"),
+    ("Kernel", "│ ├"),
+    ("Packages", "│ ├󰏖"),
+    ("Shell", "└ └"), # Note: Fastfetch uses  for Shell, which is a disk icon.
+    ("DE", " DE"),
+    ("LM", "│ ├"), # Display Manager (Fastfetch's 'lm')
+    ("WM", "│ ├"),
+    ("Theme", "│ ├󰉼"), # WM Theme
+    ("Terminal", "└ └"),
+    ("OS Age", " OS Age"), # No icon for OS Age in fastfetch
+    ("Uptime", " Uptime"),    # No icon for Uptime in fastfetch
+    ("DateTime", " DateTime"), # No icon for DateTime in fastfetch
+    ("User", "󰈡 User") # User isn't in fastfetch's main modules, but we'll try to include
+]
+
+# The prefixes are fixed, so the widest one is measured once at import time
+THEME2_MAX_KEY_DISPLAY_WIDTH = max(get_display_width(formatted_key_string) for _, formatted_key_string in THEME2_KEY_PREFIXES)
+
+# Fastfetch's config shows a consistent width for its custom format bars (52 horizontal chars).
+# We'll use this for alignment of our boxes.
+FASTFETCH_BAR_CONTENT_WIDTH = 52
+
+# Box borders that don't depend on the category name are built once
+BOX_HORIZONTAL_RUN = BOX_CHARS['horizontal'] * FASTFETCH_BAR_CONTENT_WIDTH
+BOX_TOP_BORDER = f"{BOX_CHARS['top_left']}{BOX_HORIZONTAL_RUN}{BOX_CHARS['top_right']}"
+BOX_BOTTOM_BORDER = f"{BOX_CHARS['bottom_left']}{BOX_HORIZONTAL_RUN}{BOX_CHARS['bottom_right']}"
 
 def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code, ascii_art_content, theme_id):
-    output_lines = [] 
     info_display_lines = []
+    # Look up the codes used per line once instead of going through color_text()
+    reset_code = ANSI_COLORS["reset"]
+    border_color_code = ANSI_COLORS["bright_black"]
 
-    # --- Preprocessing for Theme 2: Determine max_key_display_width for consistent alignment ---
-    max_key_display_width = 0 
-    
-    # List of all potential items that might be displayed 
-    # in Theme 2 (for consistent key alignment)
-    # Using the structure from Fastfetch config to determine max width
-    all_potential_items_for_width = [
-        ("PC", " PC"),
-        ("CPU", "│ ├"),
-        ("GPU", "│ ├󰍛"), # Note: Fastfetch uses 󰍛 for GPU, which is a memory icon.
-        ("Memory", "│ ├󰍛"),
-        ("Disk", "└ └"),
-        ("OS", " OS"),
-        ("Kernel", "│ ├"),
-        ("Packages", "│ ├󰏖"),
-        ("Shell", "└ └"), # Note: Fastfetch uses  for Shell, which is a disk icon.
-        ("DE", " DE"),
-        ("LM", "│ ├"), # Display Manager (Fastfetch's 'lm')
-        ("WM", "│ ├"),
-        ("Theme", "│ ├󰉼"), # WM Theme
-        ("Terminal", "└ └"),
-        ("OS Age", " OS Age"), # No icon for OS Age in fastfetch
-        ("Uptime", " Uptime"),    # No icon for Uptime in fastfetch
-        ("DateTime", " DateTime"), # No icon for DateTime in fastfetch
-        ("User", "󰈡 User") # User isn't in fastfetch's main modules, but we'll try to include
-    ]
-
-    for key_name, formatted_key_string in all_potential_items_for_width:
-        key_part_length = get_display_width(formatted_key_string)
-        max_key_display_width = max(max_key_display_width, key_part_length)
-    
-    # Fastfetch's config shows a consistent width for its custom format bars (52 horizontal chars).
-    # We'll use this for alignment of our boxes.
-    FASTFETCH_BAR_CONTENT_WIDTH = 52
+    max_key_display_width = THEME2_MAX_KEY_DISPLAY_WIDTH
     
     # --- Populate info_display_lines based on Theme ---
     if theme_id == 1:
@@ -583,7 +893,7 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
             'Resolution', 'Shell', 'Terminal', 'WM', 'User'
         ]
         actual_keys_in_theme1 = [k for k in theme1_keys_to_check if system_info.get(k, 'N/A') != 'N/A']
-        max_key_display_width_theme1 = max(len(key) for key in actual_keys_in_theme1) if actual_keys_in_theme1 else 0
+        max_key_display_width_theme1 = max(map(len, actual_keys_in_theme1), default=0)
 
         for key in theme1_keys_to_check:
             value = system_info.get(key, 'N/A')
@@ -617,7 +927,7 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
         # Helper to get special PC info value
         pc_info_val = system_info.get('Hostname', 'N/A')
         if system_info.get('CPU') and system_info['CPU'] != 'N/A':
-            cpu_match = re.search(r'^(.*?)\s+@', system_info['CPU'])
+            cpu_match = CPU_NAME_RE.search(system_info['CPU'])
             clean_cpu_name = cpu_match.group(1).strip() if cpu_match else system_info['CPU']
             if pc_info_val != 'N/A':
                 pc_info_val = f"{pc_info_val} ({clean_cpu_name})"
@@ -643,16 +953,18 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
                 # If GPU is a list, process each GPU on a new line
                 if key == "GPU" and isinstance(value_to_display, list):
                     if value_to_display:
+                        # Use consistent prefix for all GPU lines, like Fastfetch
+                        prefix = "│ ├" if not is_last_in_section else "└ └"
+                        gpu_key_width = max_key_display_width - get_display_width(prefix)
+                        gpu_icon_and_name = formatted_key_prefix.lstrip('│ ├└ ') # Stripped once, not per GPU
                         for j, gpu_name in enumerate(value_to_display):
                             if gpu_name == 'N/A':
                                 continue
-                            # Use consistent prefix for all GPU lines, like Fastfetch
-                            prefix = "│ ├" if not is_last_in_section else "└ └"
                             # If it's the first GPU entry, include the icon and "GPU" text
-                            key_part_for_gpu = f"{formatted_key_prefix.lstrip('│ ├└ ')}" if j == 0 else "   "
+                            key_part_for_gpu = gpu_icon_and_name if j == 0 else "   "
                             
                             # Reconstruct the line for multi-GPU
-                            final_key_part = f"{prefix}{key_part_for_gpu.ljust(max_key_display_width - get_display_width(prefix))}"
+                            final_key_part = f"{prefix}{key_part_for_gpu.ljust(gpu_key_width)}"
                             current_line = f"{final_key_part}: {gpu_name}"
                             current_category_content_lines.append(current_line)
                     else:
@@ -667,7 +979,6 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
                     # Pad based on the overall max_key_display_width calculated earlier
                     # Ensure the final string length matches desired padding after prefix
                     # We need to consider the length of the symbol + space + name + any prefix (e.g., "│ ├")
-                    key_portion_without_prefix = actual_formatted_key.lstrip('│ ├└ ') # Get icon + name part
                     padding_for_value = max_key_display_width - get_display_width(actual_formatted_key)
                     
                     current_line = f"{actual_formatted_key}{' ' * padding_for_value}: {value_to_display}"
@@ -695,7 +1006,7 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
                     f"{BOX_CHARS['horizontal'] * right_dashes}"
                     f"{BOX_CHARS['top_right']}"
                 )
-                info_display_lines.append(color_text(top_border, 'bright_black'))
+                info_display_lines.append(f"{border_color_code}{top_border}{reset_code}")
 
                 # Content lines
                 for line in current_category_content_lines:
@@ -707,8 +1018,7 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
                     info_display_lines.append(f"{line}{' ' * padding_needed}") 
                 
                 # Category box bottom border
-                bottom_border = f"{BOX_CHARS['bottom_left']}{BOX_CHARS['horizontal'] * FASTFETCH_BAR_CONTENT_WIDTH}{BOX_CHARS['bottom_right']}"
-                info_display_lines.append(color_text(bottom_border, 'bright_black'))
+                info_display_lines.append(f"{border_color_code}{BOX_BOTTOM_BORDER}{reset_code}")
                 info_display_lines.append("") # Blank line after each segmented box
 
         # Handle standalone user info (if not N/A) - not in Fastfetch's categories but keeping it.
@@ -725,16 +1035,14 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
             user_box_content_width = FASTFETCH_BAR_CONTENT_WIDTH 
             
             # User box doesn't have a category name merged into the top border.
-            user_top_border = f"{BOX_CHARS['top_left']}{BOX_CHARS['horizontal'] * user_box_content_width}{BOX_CHARS['top_right']}"
-            info_display_lines.append(color_text(user_top_border, 'bright_black'))
+            info_display_lines.append(f"{border_color_code}{BOX_TOP_BORDER}{reset_code}")
             
             # Content line for user info.
             # Pad to the FASTFETCH_BAR_CONTENT_WIDTH.
             padding_needed_user = user_box_content_width - get_display_width(user_line_content)
             info_display_lines.append(f"{user_line_content}{' ' * padding_needed_user}")
 
-            user_bottom_border = f"{BOX_CHARS['bottom_left']}{BOX_CHARS['horizontal'] * user_box_content_width}{BOX_CHARS['bottom_right']}"
-            info_display_lines.append(color_text(user_bottom_border, 'bright_black'))
+            info_display_lines.append(f"{border_color_code}{BOX_BOTTOM_BORDER}{reset_code}")
             info_display_lines.append("")
 
         # Add color splotches (as per Fastfetch's config)
@@ -743,15 +1051,16 @@ def generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code,
         info_display_lines.append(generate_color_splotches())
     
     # --- Combine ASCII Art and Info Lines for final output ---
-    ascii_art_width = max(len(line) for line in ascii_art_content) if ascii_art_content else 0
-    total_output_height = max(len(ascii_art_content), len(info_display_lines))
-
-    for i in range(total_output_height):
-        art_line = ascii_art_content[i] if i < len(ascii_art_content) else " " * ascii_art_width
-        display_info_line = info_display_lines[i] if i < len(info_display_lines) else ""
-        
-        output_lines.append(f"{ascii_art_color_code}{art_line}{ANSI_COLORS['reset']}   {text_color_code}{display_info_line}{ANSI_COLORS['reset']}")
-
+    ascii_art_width = max(map(len, ascii_art_content), default=0)
+    blank_art_line = " " * ascii_art_width # Filler for rows below the art, built once
+    # Pad the shorter column so both can be zipped row by row
+    art_column = ascii_art_content + [blank_art_line] * (len(info_display_lines) - len(ascii_art_content))
+    info_column = info_display_lines + [""] * (len(ascii_art_content) - len(info_display_lines))
+
+    output_lines = [
+        f"{ascii_art_color_code}{art_line}{reset_code}   {text_color_code}{display_info_line}{reset_code}"
+        for art_line, display_info_line in zip(art_column, info_column)
+    ]
     return "\n".join(output_lines)
 
 def main():
@@ -775,13 +1084,13 @@ def main():
         selected_theme = selected_theme_from_file
     # Else, selected_theme remains 1 (the default)
 
-    print("Gathering system information...")
+    # Shown before the probes run, so flush it now instead of waiting for the batched write
+    print("Gathering system information...", flush=True)
     system_info = get_system_info()
     
     output_block = generate_arkfetch_output(system_info, ascii_art_color_code, text_color_code, ascii_art_content, selected_theme)
-    print("\n" + output_block)
-    
-    print(f"\n{footer_message}")
+    # Output and footer go out in a single write
+    sys.stdout.write(f"\n{output_block}\n\n{footer_message}\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,10 +7,25 @@ import os
 import sys
 import subprocess
 import shutil
+import shlex
 import tempfile
 import argparse
+import json
+import sqlite3
+import time
+import zlib
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# orjson parses bytes directly and is several times faster; it is optional
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # ANSI Color codes
 class Colors:
     RESET = '\033[0m'
@@ -37,45 +52,114 @@ def print_warning(msg):
 def print_header(msg):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{msg}{Colors.RESET}\n")
 
-def run_command(cmd, check=True, capture=False):
-    """Run a shell command"""
+@lru_cache(maxsize=None)
+def which(program):
+    """Resolve a program on PATH once per run"""
+    return shutil.which(program)
+
+def run_command(cmd, check=True, capture=False, cwd=None):
+    """Run a command given as an argv list (strings are split shell-style, no shell is spawned)"""
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    program = which(cmd[0])
+    if program is None:
+        print_error(f"Command not found: {cmd[0]}")
+        return False
+    cmd = [program, *cmd[1:]]
     try:
         if capture:
-            result = subprocess.run(cmd, shell=True, check=check, 
+            result = subprocess.run(cmd, check=check, cwd=cwd,
                                    capture_output=True, text=True)
             return result.stdout.strip()
         else:
-            subprocess.run(cmd, shell=True, check=check)
+            subprocess.run(cmd, check=check, cwd=cwd)
             return True
     except subprocess.CalledProcessError as e:
         return False
 
-def check_root():
-    """Check if running as root"""
-    return os.geteuid() == 0
+# Checked once at startup; commands that go through sudo or makepkg refuse to run as root
+IS_ROOT = os.geteuid() == 0
 
 def confirm_action(prompt):
     """Ask user for confirmation"""
     response = input(f"{Colors.YELLOW}?{Colors.RESET} {prompt} [Y/n]: ").strip().lower()
     return response in ['', 'y', 'yes']
 
+# Longest query string sent in one RPC request before splitting it
+MAX_RPC_QUERY_LENGTH = 4000
+# Upper bound on concurrent git clones when installing several packages
+MAX_PARALLEL_CLONES = 8
+# How long a cached AUR search result is served before asking the RPC again
+SEARCH_CACHE_TTL = 5 * 60  # seconds
+
 class AURHelper:
     def __init__(self):
         self.aur_base = "https://aur.archlinux.org"
+        self.aur_host = urllib.parse.urlsplit(self.aur_base).netloc
+        self.connection = None  # Opened on first RPC call and kept alive between calls
         self.build_dir = Path.home() / ".cache" / "arkpkg"
         self.build_dir.mkdir(parents=True, exist_ok=True)
+        self.metadata_db = None  # Opened on first search
+
+    def open_metadata_db(self):
+        """Open the local search cache, creating it on first use"""
+        if self.metadata_db is None:
+            self.metadata_db = sqlite3.connect(self.build_dir / "metadata.db")
+            self.metadata_db.execute("PRAGMA journal_mode=WAL")
+            self.metadata_db.execute("PRAGMA synchronous=NORMAL")
+            self.metadata_db.execute(
+                "CREATE TABLE IF NOT EXISTS search(query TEXT PRIMARY KEY, fetched_at INTEGER, body BLOB)")
+        return self.metadata_db
+
+    def cached_search(self, query):
+        """Return a fresh cached search response, or None"""
+        try:
+            row = self.open_metadata_db().execute(
+                "SELECT body FROM search WHERE query = ? AND fetched_at > ?",
+                (query, int(time.time()) - SEARCH_CACHE_TTL)).fetchone()
+            return json_loads(zlib.decompress(row[0])) if row else None
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None  # A broken cache just means going to the network
+
+    def store_search(self, query, data):
+        """Save a search response (compressed JSON) for SEARCH_CACHE_TTL seconds"""
+        try:
+            with self.open_metadata_db() as db:
+                db.execute("INSERT OR REPLACE INTO search VALUES (?, ?, ?)",
+                           (query, int(time.time()), zlib.compress(json.dumps(data).encode())))
+        except sqlite3.Error:
+            pass
+
+    def rpc_get(self, path):
+        """GET an AUR RPC path over a reused HTTPS connection and parse the JSON reply"""
+        while True:
+            reused = self.connection is not None
+            if not reused:
+                self.connection = http.client.HTTPSConnection(self.aur_host, timeout=10)
+            try:
+                self.connection.request('GET', path, headers={'User-Agent': 'arkpkg'})
+                response = self.connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self.connection.close()
+                self.connection = None
+                # A reused connection may have been closed by the server while idle; retry on a fresh one
+                if not reused:
+                    raise
+        if response.status != 200:
+            raise RuntimeError(f"AUR returned HTTP {response.status}")
+        return json_loads(body)
 
     def search_aur(self, package):
         """Search for package in AUR"""
         print_info(f"Searching AUR for: {Colors.BOLD}{package}{Colors.RESET}")
-        url = f"{self.aur_base}/rpc/?v=5&type=search&arg={package}"
         
         try:
-            import urllib.request
-            import json
-            
-            with urllib.request.urlopen(url) as response:
-                data = json.loads(response.read().decode())
+            data = self.cached_search(package)
+            if data is None:
+                data = self.rpc_get(f"/rpc/?v=5&type=search&arg={urllib.parse.quote(package)}")
+                self.store_search(package, data)
                 
             if data['resultcount'] == 0:
                 print_warning("No packages found in AUR")
@@ -95,28 +179,71 @@ class AURHelper:
             print_error(f"Failed to search AUR: {e}")
             return []
 
-    def install_aur(self, package):
-        """Install package from AUR"""
-        print_header(f"Installing AUR package: {package}")
+    def multiinfo(self, packages):
+        """Look up several AUR packages with as few RPC calls as possible"""
+        info = {}
+        query = ""
+        for package in packages:
+            arg = "&" + urllib.parse.urlencode({'arg[]': package})
+            # Keep request URLs well under common server limits
+            if query and len(query) + len(arg) > MAX_RPC_QUERY_LENGTH:
+                info.update({pkg['Name']: pkg for pkg in self.rpc_get(f"/rpc/?v=5&type=info{query}")['results']})
+                query = ""
+            query += arg
+        if query:
+            info.update({pkg['Name']: pkg for pkg in self.rpc_get(f"/rpc/?v=5&type=info{query}")['results']})
+        return info
+
+    def install_aur(self, packages):
+        """Install packages from AUR"""
+        if isinstance(packages, str):
+            packages = [packages]
+        
+        try:
+            aur_info = self.multiinfo(packages)
+        except Exception as e:
+            print_error(f"Failed to query AUR: {e}")
+            return False
+        
+        missing = [package for package in packages if package not in aur_info]
+        if missing:
+            print_error(f"Not found in AUR: {', '.join(missing)}")
+            return False
         
         # Check if git is installed
-        if not shutil.which('git'):
+        if not which('git'):
             print_error("git is required to clone AUR packages")
             return False
         
-        # Clone the package
+        # Clones are network bound, so fetch them all at once; review and build stay sequential
+        print_info(f"Fetching {len(packages)} package(s) from AUR...")
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CLONES, len(packages))) as executor:
+            fetched = list(executor.map(self.clone_one, packages))
+        failed = [package for package, ok in zip(packages, fetched) if not ok]
+        if failed:
+            print_error(f"Failed to clone or update: {', '.join(failed)}")
+            return False
+        
+        for package in packages:
+            print_info(f"{Colors.BOLD}{package}{Colors.RESET} {Colors.CYAN}{aur_info[package]['Version']}{Colors.RESET}")
+            if not self.install_one(package):
+                return False
+        return True
+
+    def clone_one(self, package):
+        """Clone a package from AUR, or update the existing clone"""
         pkg_dir = self.build_dir / package
+        # PKGBUILDs only need the latest revision, so keep clones shallow
         if pkg_dir.exists():
-            print_info(f"Package directory exists. Updating...")
-            if not run_command(f"cd {pkg_dir} && git pull"):
-                print_error("Failed to update package")
-                return False
-        else:
-            clone_url = f"{self.aur_base}/{package}.git"
-            print_info(f"Cloning from AUR...")
-            if not run_command(f"git clone {clone_url} {pkg_dir}"):
-                print_error("Failed to clone package")
-                return False
+            return (run_command(['git', '-C', str(pkg_dir), 'fetch', '-q', '--depth=1', 'origin', 'master'])
+                    and run_command(['git', '-C', str(pkg_dir), 'reset', '-q', '--hard', 'origin/master']))
+        clone_url = f"{self.aur_base}/{package}.git"
+        return run_command(['git', 'clone', '-q', '--depth=1', '--single-branch', clone_url, str(pkg_dir)])
+
+    def install_one(self, package):
+        """Review and build a single cloned AUR package"""
+        print_header(f"Installing AUR package: {package}")
+        pkg_dir = self.build_dir / package
         
         # Show PKGBUILD
         pkgbuild = pkg_dir / "PKGBUILD"
@@ -136,29 +263,27 @@ class AURHelper:
         
         # Build and install
         print_info("Building package...")
-        if not run_command(f"cd {pkg_dir} && makepkg -si"):
+        if not run_command(['makepkg', '-si'], cwd=pkg_dir):
             print_error("Failed to build/install package")
             return False
         
         print_success(f"Successfully installed {package}")
         return True
 
-    def remove_aur(self, package):
-        """Remove AUR package using pacman"""
-        return self.pacman_remove(package)
+    def remove_aur(self, packages):
+        """Remove AUR packages using pacman, in a single transaction"""
+        if isinstance(packages, str):
+            packages = [packages]
+        return PacmanHelper.remove(packages)
 
 class PacmanHelper:
     @staticmethod
     def install(packages):
         """Install packages using pacman"""
-        if check_root():
-            print_error("Do not run as root. Use sudo when prompted.")
-            return False
-        
         pkg_list = ' '.join(packages)
         print_header(f"Installing packages: {pkg_list}")
         
-        if run_command(f"sudo pacman -S {pkg_list}"):
+        if run_command(['sudo', 'pacman', '-S', *packages]):
             print_success("Packages installed successfully")
             return True
         else:
@@ -168,14 +293,10 @@ class PacmanHelper:
     @staticmethod
     def remove(packages):
         """Remove packages using pacman"""
-        if check_root():
-            print_error("Do not run as root. Use sudo when prompted.")
-            return False
-        
         pkg_list = ' '.join(packages)
         print_header(f"Removing packages: {pkg_list}")
         
-        if run_command(f"sudo pacman -Rns {pkg_list}"):
+        if run_command(['sudo', 'pacman', '-Rns', *packages]):
             print_success("Packages removed successfully")
             return True
         else:
@@ -185,13 +306,9 @@ class PacmanHelper:
     @staticmethod
     def update():
         """Update system packages"""
-        if check_root():
-            print_error("Do not run as root. Use sudo when prompted.")
-            return False
-        
         print_header("Updating system packages")
         
-        if run_command("sudo pacman -Syu"):
+        if run_command(['sudo', 'pacman', '-Syu']):
             print_success("System updated successfully")
             return True
         else:
@@ -202,25 +319,25 @@ class PacmanHelper:
     def search(query):
         """Search for packages using pacman"""
         print_info(f"Searching for: {Colors.BOLD}{query}{Colors.RESET}")
-        run_command(f"pacman -Ss {query}", check=False)
+        run_command(['pacman', '-Ss', *query.split()], check=False)
 
     @staticmethod
     def info(package):
         """Show package information"""
         print_info(f"Package information: {Colors.BOLD}{package}{Colors.RESET}")
-        run_command(f"pacman -Si {package}", check=False)
+        run_command(['pacman', '-Si', package], check=False)
 
     @staticmethod
     def list_installed():
         """List installed packages"""
         print_header("Installed packages")
-        run_command("pacman -Q", check=False)
+        run_command(['pacman', '-Q'], check=False)
 
 class FlatpakHelper:
     @staticmethod
     def check_flatpak():
         """Check if flatpak is installed"""
-        if not shutil.which('flatpak'):
+        if not which('flatpak'):
             print_error("Flatpak is not installed")
             print_info("Install it with: sudo pacman -S flatpak")
             return False
@@ -235,7 +352,7 @@ class FlatpakHelper:
         pkg_list = ' '.join(packages)
         print_header(f"Installing flatpak: {pkg_list}")
         
-        if run_command(f"flatpak install -y flathub {pkg_list}"):
+        if run_command(['flatpak', 'install', '-y', 'flathub', *packages]):
             print_success("Flatpak installed successfully")
             return True
         else:
@@ -251,7 +368,7 @@ class FlatpakHelper:
         pkg_list = ' '.join(packages)
         print_header(f"Removing flatpak: {pkg_list}")
         
-        if run_command(f"flatpak uninstall -y {pkg_list}"):
+        if run_command(['flatpak', 'uninstall', '-y', *packages]):
             print_success("Flatpak removed successfully")
             return True
         else:
@@ -266,7 +383,7 @@ class FlatpakHelper:
         
         print_header("Updating flatpak applications")
         
-        if run_command("flatpak update -y"):
+        if run_command(['flatpak', 'update', '-y']):
             print_success("Flatpaks updated successfully")
             return True
         else:
@@ -280,7 +397,7 @@ class FlatpakHelper:
             return False
         
         print_info(f"Searching flatpak for: {Colors.BOLD}{query}{Colors.RESET}")
-        run_command(f"flatpak search {query}", check=False)
+        run_command(['flatpak', 'search', *query.split()], check=False)
 
     @staticmethod
     def list_installed():
@@ -289,7 +406,7 @@ class FlatpakHelper:
             return False
         
         print_header("Installed flatpak applications")
-        run_command("flatpak list", check=False)
+        run_command(['flatpak', 'list'], check=False)
 
     @staticmethod
     def info(package):
@@ -298,7 +415,7 @@ class FlatpakHelper:
             return False
         
         print_info(f"Flatpak information: {Colors.BOLD}{package}{Colors.RESET}")
-        run_command(f"flatpak info {package}", check=False)
+        run_command(['flatpak', 'info', package], check=False)
 
     @staticmethod
     def run_app(app):
@@ -307,7 +424,7 @@ class FlatpakHelper:
             return False
         
         print_info(f"Running flatpak: {Colors.BOLD}{app}{Colors.RESET}")
-        run_command(f"flatpak run {app}", check=False)
+        run_command(['flatpak', 'run', app], check=False)
 
 def print_logo():
     """Print arkpkg logo"""
@@ -343,8 +460,8 @@ def main():
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
     # AUR install
-    install_parser = subparsers.add_parser('install', help='Install package from AUR')
-    install_parser.add_argument('package', help='Package name')
+    install_parser = subparsers.add_parser('install', help='Install packages from AUR')
+    install_parser.add_argument('packages', nargs='+', help='Package name(s)')
     
     # AUR search
     search_parser = subparsers.add_parser('search', help='Search AUR packages')
@@ -404,19 +521,24 @@ def main():
         parser.print_help()
         return
     
+    if IS_ROOT and (args.command in ('install', 'remove') or
+                    (args.command == 'pm' and args.pm_command in ('install', 'remove', 'update'))):
+        print_error("Do not run as root. Use sudo when prompted.")
+        sys.exit(1)
+    
     aur = AURHelper()
     pacman = PacmanHelper()
     flatpak = FlatpakHelper()
     
     try:
         if args.command == 'install':
-            aur.install_aur(args.package)
+            aur.install_aur(args.packages)
         
         elif args.command == 'search':
             aur.search_aur(args.query)
         
         elif args.command == 'remove':
-            pacman.remove(args.packages)
+            aur.remove_aur(args.packages)
         
         elif args.command == 'pm':
             if args.pm_command == 'install':
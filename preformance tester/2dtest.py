@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 import sys
 import random
 import time # Import the time module for the timer
@@ -24,49 +25,67 @@ DUPLICATES_PER_FRAME = 5 # You can increase this number to spawn even more cubes
 MAX_DUPLICATE_OFFSET = 20 # Adjust this value to make the duplicates more spread out
 
 # 5. Timer Variables
-start_time = time.time() # Record the time when the application starts
 test_duration = 20 # seconds - the application will run for this duration
-
-# 6. Sprite Class
-class Sprite:
-    def __init__(self, x, y, color):
-        """
-        Initializes a new Sprite object.
-        Args:
-            x (int): The initial x-coordinate (top-left) of the sprite.
-            y (int): The initial y-coordinate (top-left) of the sprite.
-            color (tuple): The RGB color of the sprite.
-        """
-        self.image = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
-        self.image.fill(color)
-        self.rect = self.image.get_rect(topleft=(x, y))
-
-    def draw(self, surface):
-        """
-        Draws the sprite onto the given surface.
-        Args:
-            surface (pygame.Surface): The surface to draw the sprite on.
-        """
-        surface.blit(self.image, self.rect)
+# Integer monotonic deadline, so the per-frame check is a plain int comparison
+deadline_ns = time.monotonic_ns() + test_duration * 1_000_000_000
+
+# 6. Sprite Storage
+# Duplicates are kept as parallel NumPy arrays (positions plus a palette index)
+# rather than one Surface/Rect object each. Every duplicate is a solid square, so
+# they all share a small palette of pre-filled Surfaces.
+PALETTE_SIZE = 16
+# Duplicates live in a fixed-size ring buffer: once it is full, each new duplicate
+# replaces the oldest one. The test then measures steady-state throughput at a
+# fixed on-screen sprite count instead of slowing down as the count grows forever.
+MAX_DUPLICATES = 5000
+SPAWN_SLOTS = np.arange(DUPLICATES_PER_FRAME)
+# Exclusive upper bounds for the main sprite's top-left corner
+MAIN_SPRITE_BOUNDS = (WIDTH - SPRITE_SIZE + 1, HEIGHT - SPRITE_SIZE + 1)
+
+def make_square(color):
+    """Returns a SPRITE_SIZE square Surface filled with the given RGB color."""
+    # convert() matches the display's pixel format so blits skip a per-pixel conversion
+    surface = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE)).convert()
+    surface.fill(color)
+    return surface
 
 # 7. Initial Game State Setup
 main_sprite_color = RED
 # Start the main sprite at a random initial position.
 initial_x = random.randint(0, WIDTH - SPRITE_SIZE)
 initial_y = random.randint(0, HEIGHT - SPRITE_SIZE)
-main_sprite = Sprite(initial_x, initial_y, main_sprite_color)
-all_sprites = [main_sprite]
+main_image = make_square(main_sprite_color)
+main_rect = main_image.get_rect(topleft=(initial_x, initial_y))
+
+# Slightly different shades of the main color, one Surface per palette entry.
+palette = np.empty(PALETTE_SIZE, dtype=object)
+for i in range(PALETTE_SIZE):
+    palette[i] = make_square((
+        (main_sprite_color[0] + random.randint(-50, 50)) % 256,
+        (main_sprite_color[1] + random.randint(-50, 50)) % 256,
+        (main_sprite_color[2] + random.randint(-50, 50)) % 256
+    ))
+
+positions = np.empty((MAX_DUPLICATES, 2), dtype=np.int32)
+color_ids = np.empty(MAX_DUPLICATES, dtype=np.intp)
+next_slot = 0 # Ring buffer write position
+duplicate_count = 0 # Duplicates currently on screen
+total_generated = 1 # Every sprite ever spawned, including the main sprite
 
 # 8. FPS Counter and Tracking Setup
 clock = pygame.time.Clock()
 font = pygame.font.Font(None, 36)
 fps_values = []
+# Last rendered value and Surface for each on-screen counter; text is only
+# re-rendered when the number it shows changes.
+last_fps_int, fps_text = -1, None
+last_sprite_count, sprite_count_text = -1, None
 
 # 9. Game Loop
 running = True
 while running:
     # --- Check for Timer Expiration ---
-    if time.time() - start_time >= test_duration:
+    if time.monotonic_ns() >= deadline_ns:
         running = False # Exit the loop if the test duration is over
 
     # --- Event Handling ---
@@ -76,57 +95,56 @@ while running:
 
     # --- Sprite Movement Logic (Automatic Random Movement) ---
     # Store the main sprite's position *before* potential movement for duplication.
-    old_rect_pos = main_sprite.rect.topleft
+    old_rect_pos = main_rect.topleft
 
     # Generate new random coordinates for the main sprite.
     # Ensure the new position keeps the entire sprite within the screen boundaries.
-    new_x = random.randint(0, WIDTH - SPRITE_SIZE)
-    new_y = random.randint(0, HEIGHT - SPRITE_SIZE)
-
     # Move the main sprite to the new random position.
-    main_sprite.rect.topleft = (new_x, new_y)
+    main_rect.topleft = np.random.randint(0, MAIN_SPRITE_BOUNDS).tolist()
 
     # --- Sprite Duplication Logic (Spawning Multiple Duplicates) ---
     # We always consider the main sprite "moved" since it teleports every frame.
-    # Now, we duplicate it multiple times per frame based on DUPLICATES_PER_FRAME.
-    for _ in range(DUPLICATES_PER_FRAME):
-        # Generate a slightly different color for each duplicate.
-        duplicate_color = (
-            (main_sprite_color[0] + random.randint(-50, 50)) % 256,
-            (main_sprite_color[1] + random.randint(-50, 50)) % 256,
-            (main_sprite_color[2] + random.randint(-50, 50)) % 256
-        )
-        # Calculate a random offset for the new duplicate
-        offset_x = random.randint(-MAX_DUPLICATE_OFFSET, MAX_DUPLICATE_OFFSET)
-        offset_y = random.randint(-MAX_DUPLICATE_OFFSET, MAX_DUPLICATE_OFFSET)
-
-        # Create the new sprite at the OLD position of the main sprite PLUS the offset
-        new_sprite = Sprite(old_rect_pos[0] + offset_x, old_rect_pos[1] + offset_y, duplicate_color)
-        all_sprites.append(new_sprite)
-
-        # Optional: Limit the number of sprites if performance becomes too low.
-        # This removes the oldest duplicate when a certain number is exceeded.
-        # if len(all_sprites) > 2000: # Example limit
-        #     all_sprites.pop(1) # Index 0 is the main sprite, so remove from index 1 onwards
+    # All duplicates for this frame are generated with one call per array.
+    slots = (next_slot + SPAWN_SLOTS) % MAX_DUPLICATES
+    # Place each duplicate at the OLD position of the main sprite plus a random offset
+    positions[slots] = np.add(
+        old_rect_pos,
+        np.random.randint(-MAX_DUPLICATE_OFFSET, MAX_DUPLICATE_OFFSET + 1, (DUPLICATES_PER_FRAME, 2))
+    )
+    color_ids[slots] = np.random.randint(0, PALETTE_SIZE, DUPLICATES_PER_FRAME)
+    next_slot = (next_slot + DUPLICATES_PER_FRAME) % MAX_DUPLICATES
+    duplicate_count = min(duplicate_count + DUPLICATES_PER_FRAME, MAX_DUPLICATES)
+    total_generated += DUPLICATES_PER_FRAME
 
 
     # --- Drawing ---
     SCREEN.fill(BLACK) # Clear the screen
 
-    # Draw all sprites
-    for sprite in all_sprites:
-        sprite.draw(SCREEN)
+    # Draw all sprites, the duplicates in a single batched call
+    # Oldest duplicates first, so the newest ones stay on top
+    draw_order = np.r_[next_slot:duplicate_count, 0:next_slot]
+    SCREEN.blit(main_image, main_rect)
+    SCREEN.blits(
+        zip(palette[color_ids[draw_order]].tolist(), positions[draw_order].tolist()),
+        doreturn=False
+    )
 
     # --- FPS Counter Display ---
     current_fps = clock.get_fps()
     if current_fps > 0: # Only record valid FPS values
         fps_values.append(current_fps)
-    fps_text = font.render(f"FPS: {int(current_fps)}", True, WHITE)
+    fps_int = int(current_fps)
+    if fps_int != last_fps_int:
+        fps_text = font.render(f"FPS: {fps_int}", True, WHITE)
+        last_fps_int = fps_int
     SCREEN.blit(fps_text, (10, 10))
 
     # --- Sprite Counter Display ---
     # Render the current number of sprites on the screen
-    sprite_count_text = font.render(f"Sprites: {len(all_sprites)}", True, WHITE)
+    sprite_count = duplicate_count + 1
+    if sprite_count != last_sprite_count:
+        sprite_count_text = font.render(f"Sprites: {sprite_count}", True, WHITE)
+        last_sprite_count = sprite_count
     SCREEN.blit(sprite_count_text, (10, 50)) # Position it below the FPS counter
 
     # --- Update Display ---
@@ -147,7 +165,7 @@ if fps_values:
         avg_fps = sum(filtered_fps_values) / len(filtered_fps_values)
 
         print("\n--- FPS Statistics ---")
-        print(f"Total Sprites Generated: {len(all_sprites)}")
+        print(f"Total Sprites Generated: {total_generated}")
         print(f"Lowest FPS: {min_fps:.2f}")
         print(f"Highest FPS: {max_fps:.2f}")
         print(f"Average FPS: {avg_fps:.2f}")
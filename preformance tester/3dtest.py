@@ -1,15 +1,15 @@
 import sys
 import time
-import random
 from ursina import *
+import numpy as np
 
 # 1. Initialize Ursina Application
 app = Ursina()
 
 # 2. Global Variables for FPS Tracking and Duplication
 fps_values = []
-start_time = time.time()
 test_duration = 10  # seconds
+deadline_ns = time.monotonic_ns() + test_duration * 1_000_000_000
 duplication_active = True
 cube_count = 0
 
@@ -29,32 +29,33 @@ fps_text = Text(text="FPS: 0", origin=(-0.85, 0.45), scale=2, color=color.white)
 
 # 5. Removed custom Cube Counter Text Entity
 
+# Shared cube geometry: the model and texture are loaded once here and instanced
+# into every new cube instead of being set up again per Entity.
+cube_prototype = Entity(model='cube', texture='white_cube', color=color.white, enabled=False)
+
 
 # 6. `update` Function (Game Loop)
 def update():
     global duplication_active, cube_count
 
     # Check if the test duration has passed
-    if time.time() - start_time >= test_duration and duplication_active:
+    if duplication_active and time.monotonic_ns() >= deadline_ns:
         duplication_active = False # Stop duplicating
         print_fps_statistics() # Print results
         application.quit() # Close the Ursina window
 
     if duplication_active:
+        # We'll slightly offset each new cube to make them somewhat visible
+        # This creates a "pile" of cubes.
+        # Adding a small random offset can make the pile less uniform.
+        # All offsets for this frame come from a single RNG call.
+        cube_offsets = np.random.uniform(-0.5, 0.5, (CUBES_PER_FRAME, 3)).tolist()
+
         # Loop to create multiple cubes per frame
-        for _ in range(CUBES_PER_FRAME):
-            # We'll slightly offset each new cube to make them somewhat visible
-            # This creates a "pile" of cubes.
-            # Adding a small random offset can make the pile less uniform.
-            new_cube_position = (
-                random.uniform(-0.5, 0.5), # X-offset
-                random.uniform(-0.5, 0.5), # Y-offset
-                random.uniform(-0.5, 0.5)  # Z-offset
-            )
+        for new_cube_position in cube_offsets:
             # Create the new cube with slightly smaller scale for better visibility of overlap
-            new_cube = Entity(model='cube', texture='white_cube', color=color.white,
-                              position=new_cube_position,
-                              scale=0.5)
+            new_cube = Entity(position=new_cube_position, scale=0.5)
+            cube_prototype.model.instanceTo(new_cube)
             # The Ursina engine automatically adds entities to the scene when created,
             # so we don't need a separate list like `all_cubes` for drawing.
             # We only increment a counter for statistics.
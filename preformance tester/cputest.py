@@ -1,39 +1,62 @@
 import time
 import sys
+import math
+import numpy as np # Vectorized sieve instead of per-number trial division
 
 # --- Configuration ---
 TEST_DURATION = 10  # seconds - how long the test will run
 MAX_NUMBER_TO_CHECK = 200000 # Starting upper limit for prime checking, will adjust dynamically if needed
+SEGMENT_SIZE = 1 << 22 # Numbers sieved per step (4M booleans, fits comfortably in cache/RAM)
 
-# --- Prime Number Checking Function ---
-def is_prime(n):
+# --- Prime Sieve Functions ---
+def simple_sieve(limit):
     """
-    Checks if a number is prime using trial division.
+    Returns all primes below limit using a Sieve of Eratosthenes.
     """
-    if n < 2:
-        return False
-    # Only need to check divisors up to the square root of n
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
+    sieve = np.ones(limit, dtype=np.bool_)
+    sieve[:2] = False
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False # One strided C-level write per prime
+    return np.flatnonzero(sieve)
+
+def count_primes_in_segment(low, high, base_primes):
+    """
+    Counts primes in [low, high) by crossing off multiples of the base primes.
+    base_primes must contain every prime up to sqrt(high).
+    """
+    segment = np.ones(high - low, dtype=np.bool_)
+    if low < 2:
+        segment[:2 - low] = False
+    for p in base_primes.tolist():
+        if p * p >= high:
+            break
+        start = max(p * p, -(-low // p) * p) # First multiple of p inside the segment
+        segment[start - low::p] = False
+    return int(np.count_nonzero(segment))
 
 # --- Main CPU Test Logic ---
 def run_cpu_test():
     start_time = time.time()
     primes_found = 0
-    current_number = 2 # Start checking for primes from 2
+    current_number = 0 # Start of the next segment to sieve
+    base_primes = simple_sieve(2)
+    base_limit = 2
 
     print("-------------------------")
     print("   CPU Performance Test  ")
     print(" (Prime Number Generation) ")
     print("-------------------------")
 
-    # Run the test for the specified duration
+    # Run the test for the specified duration, sieving consecutive segments
     while time.time() - start_time < TEST_DURATION:
-        if is_prime(current_number):
-            primes_found += 1
-        current_number += 1
+        segment_end = current_number + SEGMENT_SIZE
+        # Grow the base primes so they always cover sqrt(segment_end)
+        if base_limit * base_limit < segment_end:
+            base_limit = math.isqrt(segment_end) * 2 + 1
+            base_primes = simple_sieve(base_limit)
+        primes_found += count_primes_in_segment(current_number, segment_end, base_primes)
+        current_number = segment_end
 
     end_time = time.time()
     time_taken = end_time - start_time
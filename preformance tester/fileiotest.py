@@ -2,6 +2,7 @@ import time
 import sys
 import os
 import random
+import mmap
 
 # --- Configuration ---
 TEST_DURATION = 10  # seconds
@@ -26,16 +27,26 @@ def run_file_io_test():
 
     # Generate random data for writing
     # Generate once to avoid CPU bottleneck during write test
-    data_to_write = os.urandom(BLOCK_SIZE_BYTES)
+    # An anonymous mmap is page aligned, which O_DIRECT requires
+    data_to_write = mmap.mmap(-1, BLOCK_SIZE_BYTES)
+    data_to_write.write(os.urandom(BLOCK_SIZE_BYTES))
 
     try:
         # --- Write Test ---
         print(f"Starting write test for {TEST_DURATION} seconds...")
+        # Bypass the page cache where possible so the disk is measured, not RAM
+        write_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) # O_BINARY: no newline translation on Windows
+        try:
+            fd = os.open(TEMP_FILE_NAME, write_flags | getattr(os, "O_DIRECT", 0))
+        except OSError: # e.g. tmpfs doesn't support O_DIRECT
+            fd = os.open(TEMP_FILE_NAME, write_flags)
+            print("Note: O_DIRECT unavailable here, writes go through the page cache.")
         write_start_time = time.time()
-        with open(TEMP_FILE_NAME, "wb") as f:
+        try:
             while time.time() - write_start_time < TEST_DURATION:
-                f.write(data_to_write)
-                total_bytes_written += BLOCK_SIZE_BYTES
+                total_bytes_written += os.write(fd, data_to_write)
+        finally:
+            os.close(fd)
         write_end_time = time.time()
         write_time_taken = write_end_time - write_start_time
         write_speed_mbps = (total_bytes_written / (1024 * 1024)) / write_time_taken if write_time_taken > 0 else 0
@@ -49,15 +60,15 @@ def run_file_io_test():
 
         # --- Read Test ---
         print(f"Starting read test for {TEST_DURATION} seconds...")
+        read_buffer = bytearray(BLOCK_SIZE_BYTES) # Reused for every block
         read_start_time = time.time()
-        while time.time() - read_start_time < TEST_DURATION:
-            with open(TEMP_FILE_NAME, "rb") as f:
-                while True:
-                    chunk = f.read(BLOCK_SIZE_BYTES)
-                    if not chunk: # End of file
-                        f.seek(0) # Go back to beginning to read again
-                        break
-                    total_bytes_read += len(chunk)
+        with open(TEMP_FILE_NAME, "rb", buffering=0) as f:
+            while time.time() - read_start_time < TEST_DURATION:
+                bytes_read = f.readinto(read_buffer)
+                if not bytes_read: # End of file
+                    f.seek(0) # Go back to beginning to read again
+                    continue
+                total_bytes_read += bytes_read
         read_end_time = time.time()
         read_time_taken = read_end_time - read_start_time
         read_speed_mbps = (total_bytes_read / (1024 * 1024)) / read_time_taken if read_time_taken > 0 else 0
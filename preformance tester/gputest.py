@@ -2,10 +2,22 @@ import time
 import sys
 import numpy as np # Used for high-performance array operations
 
+try:
+    from scipy.linalg.blas import sgemm # Direct BLAS call, skips NumPy's dispatch per iteration
+except ImportError:
+    sgemm = None
+
+try:
+    import cupy as cp # Runs the multiplications on a CUDA GPU when one is present
+    HAVE_CUPY = cp.cuda.runtime.getDeviceCount() > 0
+except Exception: # Not installed, or no usable CUDA driver/device
+    HAVE_CUPY = False
+
 # --- Configuration ---
 TEST_DURATION = 10  # seconds
 MATRIX_SIZE = 500  # Size of the square matrices (e.g., 500x500)
                    # Increase this for more intensive computation. Be mindful of RAM!
+OPS_PER_TIME_CHECK = 16 # Multiplications between clock reads; raise it when shrinking MATRIX_SIZE
 
 # --- Main GPU Compute Test Logic ---
 def run_gpu_compute_test():
@@ -15,22 +27,60 @@ def run_gpu_compute_test():
     print(" Simulated GPU Compute Test")
     print(" (Matrix Multiplication with NumPy) ")
     print("-------------------------")
-    print("Note: This uses NumPy and runs on CPU.")
-    print("      It simulates the *type* of heavy numerical task a GPU excels at.")
+    if HAVE_CUPY:
+        print("Note: CuPy found, running on the CUDA GPU.")
+    else:
+        print("Note: This uses NumPy and runs on CPU.")
+        print("      It simulates the *type* of heavy numerical task a GPU excels at.")
 
     # Initialize two random matrices
     # Use float32 for potentially faster computation if a GPU backend were available
-    a = np.random.rand(MATRIX_SIZE, MATRIX_SIZE).astype(np.float32)
-    b = np.random.rand(MATRIX_SIZE, MATRIX_SIZE).astype(np.float32)
-
-    start_time = time.time()
+    # Generated directly as float32, without a float64 temporary and cast
+    # a, b and the result buffer c are views into one contiguous allocation
+    matrices = np.empty((3, MATRIX_SIZE, MATRIX_SIZE), dtype=np.float32)
+    a, b, c = matrices # c is the result buffer, reused every iteration
+    rng = np.random.default_rng()
+    rng.random(dtype=np.float32, out=a)
+    rng.random(dtype=np.float32, out=b)
 
-    while time.time() - start_time < TEST_DURATION:
-        # Perform matrix multiplication
-        _ = np.dot(a, b)
-        total_operations += 1
+    # Each path runs one untimed multiplication first, so BLAS thread-pool startup
+    # is not counted in the measurement window. The clock is then read once per
+    # batch of OPS_PER_TIME_CHECK multiplications rather than after every one.
+    if HAVE_CUPY:
+        # Copy the inputs to the GPU once; the loop only launches cuBLAS kernels.
+        # Launches are asynchronous, so wait for each batch before reading the clock.
+        d_a, d_b = cp.asarray(a), cp.asarray(b)
+        d_c = cp.empty_like(d_a)
+        cp.dot(d_a, d_b, out=d_c)
+        cp.cuda.Device().synchronize()
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < TEST_DURATION:
+            for _ in range(OPS_PER_TIME_CHECK):
+                # Perform matrix multiplication
+                cp.dot(d_a, d_b, out=d_c)
+            cp.cuda.Device().synchronize()
+            total_operations += OPS_PER_TIME_CHECK
+    elif sgemm is not None:
+        # BLAS is column-major, so compute c.T = b.T @ a.T: the transposed views are
+        # Fortran-contiguous, which lets sgemm read a and b and write c without copies.
+        a_t, b_t, c_t = a.T, b.T, c.T
+        sgemm(1.0, b_t, a_t, c=c_t, overwrite_c=1)
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < TEST_DURATION:
+            for _ in range(OPS_PER_TIME_CHECK):
+                # Perform matrix multiplication
+                sgemm(1.0, b_t, a_t, c=c_t, overwrite_c=1)
+            total_operations += OPS_PER_TIME_CHECK
+    else:
+        np.dot(a, b, out=c)
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < TEST_DURATION:
+            for _ in range(OPS_PER_TIME_CHECK):
+                # Perform matrix multiplication
+                np.dot(a, b, out=c)
+            total_operations += OPS_PER_TIME_CHECK
 
-    end_time = time.time()
+    end_time = time.perf_counter()
     time_taken = end_time - start_time
 
     print(f"Total Matrix Multiplications (size {MATRIX_SIZE}x{MATRIX_SIZE}): {total_operations}")
@@ -1,18 +1,22 @@
 import time
 import sys
 import gc # Import garbage collector to force collection
+from collections import deque
+import numpy as np # Each block is one contiguous buffer instead of 100k int objects
 
 # --- Configuration ---
 TEST_DURATION = 10  # seconds
-ALLOCATION_SIZE_ELEMENTS = 100000 # Number of integers in each list created
-ALLOCATION_CYCLES_PER_REPORT = 10 # Report progress every X cycles
+ALLOCATION_SIZE_ELEMENTS = 100000 # Number of 64-bit integers in each block created
+ALLOCATION_CYCLES_PER_REPORT = 10 # Number of blocks kept alive at once
+GC_INTERVAL = 1.0 # seconds between forced garbage collections
 
 # --- Main Memory Test Logic ---
 def run_memory_test():
     start_time = time.time()
     total_allocations = 0
-    test_list = [] # This list will hold our allocated 'blocks'
-    cycle_count = 0
+    # Holds our allocated 'blocks'; once full, appending frees the oldest block
+    test_list = deque(maxlen=ALLOCATION_CYCLES_PER_REPORT)
+    last_gc = start_time
 
     print("-------------------------")
     print("   Memory Performance Test")
@@ -20,17 +24,17 @@ def run_memory_test():
     print("-------------------------")
 
     while time.time() - start_time < TEST_DURATION:
-        # Allocate: Create a new large list
-        test_list.append(list(range(ALLOCATION_SIZE_ELEMENTS)))
+        # Allocate: Create a new large block and touch every page of it
+        block = np.empty(ALLOCATION_SIZE_ELEMENTS, dtype=np.int64)
+        block.fill(0)
+        test_list.append(block)
         total_allocations += 1
 
-        cycle_count += 1
-
-        # Periodically deallocate to simulate churn and prevent excessive memory usage
-        if cycle_count % ALLOCATION_CYCLES_PER_REPORT == 0:
-            if test_list: # Ensure there's something to pop
-                test_list.pop(0) # Remove the oldest allocated block
-            gc.collect() # Force garbage collection
+        # Periodically force a collection, on a timer rather than every few cycles
+        now = time.time()
+        if now - last_gc >= GC_INTERVAL:
+            gc.collect()
+            last_gc = now
 
     end_time = time.time()
     time_taken = end_time - start_time
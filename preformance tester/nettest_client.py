@@ -1,38 +1,88 @@
 import socket
 import time
 import sys
+import os
+import argparse
+import tempfile
 
 HOST = '127.0.0.1'  # The server's hostname or IP address
 PORT = 12345        # The port used by the server
 TEST_DURATION = 8   # seconds for the client to run its test (slightly less than orchestrator's timeout)
-DATA_CHUNK_SIZE = 4096 # Bytes to send/receive per operation
+DATA_CHUNK_SIZE = 65536 # Bytes to send/receive per operation
+UDP_PACKET_SIZE = 1400 # Datagram size for the 'udp' transport, fits in a standard MTU
+UNIX_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'nettest.sock') # Must match nettest_server.py
+# AF_UNIX skips the TCP/IP stack entirely, so prefer it where the platform has it
+DEFAULT_TRANSPORT = 'unix' if hasattr(socket, 'AF_UNIX') else 'tcp'
 
-def run_client():
+def recv_exactly(sock, view):
+    """Fills view from sock. Returns the number of bytes read, short only if the peer closed."""
+    received = 0
+    while received < len(view):
+        n = sock.recv_into(view[received:])
+        if not n:
+            break
+        received += n
+    return received
+
+def open_connection(transport):
+    """Returns a socket connected to the echo server over the given transport."""
+    if transport == 'unix':
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = UNIX_SOCKET_PATH
+    elif transport == 'udp':
+        # A connected UDP socket can use the same send/recv_into calls as a stream
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        address = (HOST, PORT)
+    else:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Send each chunk immediately
+        address = (HOST, PORT)
+    try:
+        s.connect(address)
+    except OSError:
+        s.close()
+        raise
+    return s
+
+def run_client(transport, zerocopy=False):
     total_bytes_sent = 0
     total_bytes_received = 0
-    test_data = b'X' * DATA_CHUNK_SIZE # Prepare a chunk of data to send
+    chunk_size = UDP_PACKET_SIZE if transport == 'udp' else DATA_CHUNK_SIZE
+    test_data = b'X' * chunk_size # Prepare a chunk of data to send
+    recv_view = memoryview(bytearray(chunk_size)) # Reused for every echo, no per-recv allocation
+    data_file = None
+    if zerocopy:
+        # sendfile() hands the chunk to the kernel straight from the page cache,
+        # skipping the user-to-kernel copy that sendall() makes
+        data_file = tempfile.TemporaryFile()
+        data_file.write(test_data)
+        data_file.flush()
 
     print("-------------------------")
     print(" Network Performance Test")
     print(" (Loopback Echo Throughput) ")
     print("-------------------------")
+    print(f"Transport: {transport}{' (sendfile)' if zerocopy else ''}")
 
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.connect((HOST, PORT))
+        with open_connection(transport) as s:
             s.settimeout(1) # Set a timeout for socket operations
 
             start_time = time.time()
             while time.time() - start_time < TEST_DURATION:
                 try:
-                    s.sendall(test_data)
-                    total_bytes_sent += len(test_data)
+                    if data_file:
+                        s.sendfile(data_file, 0, chunk_size)
+                    else:
+                        s.sendall(test_data)
+                    total_bytes_sent += chunk_size
 
-                    received_data = s.recv(DATA_CHUNK_SIZE)
-                    if not received_data:
+                    # Wait for the whole chunk to be echoed back before sending the next
+                    received = recv_exactly(s, recv_view)
+                    total_bytes_received += received
+                    if received < chunk_size:
                         print("Server closed connection prematurely.")
                         break
-                    total_bytes_received += len(received_data)
 
                 except socket.timeout:
                     print("Network client timed out (server might be slow or test finished).")
@@ -56,12 +106,23 @@ def run_client():
             print(f"Send Speed: {send_speed_mbps:.2f} MB/s")
             print(f"Receive Speed: {recv_speed_mbps:.2f} MB/s")
 
-    except ConnectionRefusedError:
-        print(f"Error: Connection refused. Is the server running on {HOST}:{PORT}?")
+    except (ConnectionRefusedError, FileNotFoundError):
+        address = UNIX_SOCKET_PATH if transport == 'unix' else f"{HOST}:{PORT}"
+        print(f"Error: Connection refused. Is the server running on {address}?")
     except Exception as e:
         print(f"An error occurred during network client test: {e}")
     finally:
+        if data_file:
+            data_file.close()
         sys.exit()
 
 if __name__ == "__main__":
-    run_client()
+    parser = argparse.ArgumentParser(description="Loopback echo throughput client for the network test")
+    parser.add_argument('--transport', choices=['tcp', 'udp', 'unix'], default=DEFAULT_TRANSPORT,
+                        help=f"Socket type to connect with (default: {DEFAULT_TRANSPORT})")
+    parser.add_argument('--zerocopy', action='store_true',
+                        help="Send with sendfile() from a temporary file instead of sendall() (tcp/unix only)")
+    args = parser.parse_args()
+    if args.zerocopy and args.transport == 'udp':
+        parser.error("--zerocopy needs a stream transport (tcp or unix)")
+    run_client(args.transport, args.zerocopy)
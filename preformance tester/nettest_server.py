@@ -1,37 +1,100 @@
 import socket
 import sys
 import time
+import os
+import argparse
+import tempfile
+import selectors
 
 HOST = '127.0.0.1'  # Standard loopback interface address (localhost)
 PORT = 12345        # Port to listen on (non-privileged ports are > 1023)
+DATA_CHUNK_SIZE = 65536 # Matches the client's chunk size
+ACCEPT_TIMEOUT = 5 # seconds to wait for the first client
+IDLE_TIMEOUT = 1 # seconds without any traffic before assuming the test is over
+UNIX_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'nettest.sock') # Used by the 'unix' transport
+# AF_UNIX skips the TCP/IP stack entirely, so prefer it where the platform has it
+DEFAULT_TRANSPORT = 'unix' if hasattr(socket, 'AF_UNIX') else 'tcp'
 
-def run_server():
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # Allow address reuse
-            s.bind((HOST, PORT))
-            s.listen()
-            print(f"Server listening on {HOST}:{PORT}")
+def echo_stream(s):
+    """Echoes data on every connection accepted from a listening stream socket until the last client leaves."""
+    # This server echoes data and then exits gracefully once every client has closed,
+    # or after a short timeout if no more data arrives.
+    # It's designed for the orchestrator to manage its lifetime.
+    recv_view = memoryview(bytearray(DATA_CHUNK_SIZE)) # Reused for every receive
+    open_connections = 0
+    timeout = ACCEPT_TIMEOUT
+    with selectors.DefaultSelector() as sel:
+        s.setblocking(False)
+        sel.register(s, selectors.EVENT_READ)
+        while True:
+            events = sel.select(timeout)
+            if not events:
+                break # Nothing to accept or echo within the timeout, assume done
+            for key, _ in events:
+                if key.fileobj is s:
+                    conn, addr = s.accept()
+                    print(f"Connected by {addr or 'unix socket client'}")
+                    # Reads only happen once the selector reports data, so the connection can
+                    # stay blocking and sendall() never has to deal with partial writes
+                    conn.setblocking(True)
+                    if conn.family != getattr(socket, 'AF_UNIX', None):
+                        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Echo each chunk immediately
+                    sel.register(conn, selectors.EVENT_READ)
+                    open_connections += 1
+                    timeout = IDLE_TIMEOUT
+                    continue
+                conn = key.fileobj
+                try:
+                    n = conn.recv_into(recv_view) # Receive up to 64KB of data
+                    if n:
+                        conn.sendall(recv_view[:n]) # Echo back the received data
+                        continue
+                except ConnectionResetError:
+                    print("Client disconnected unexpectedly.")
+                # Client closed (or reset) the connection
+                sel.unregister(conn)
+                conn.close()
+                open_connections -= 1
+            if timeout == IDLE_TIMEOUT and open_connections == 0:
+                break # Every client has finished
+
+def echo_datagrams(s):
+    """Echoes datagrams back to their sender until none arrive for a second."""
+    s.settimeout(ACCEPT_TIMEOUT) # Wait for the first packet as long as we would wait for a connection
+    recv_view = memoryview(bytearray(DATA_CHUNK_SIZE)) # Reused for every receive
+    while True:
+        try:
+            n, addr = s.recvfrom_into(recv_view)
+            s.sendto(recv_view[:n], addr) # Echo back the received packet
+            s.settimeout(IDLE_TIMEOUT)
+        except socket.timeout:
+            break # No more data from client for 1 second, assume done
 
-            # This server will accept one connection, echo data, and then exit gracefully
-            # after a short timeout if no more data, or when the client closes.
-            # It's designed for the orchestrator to manage its lifetime.
-            s.settimeout(5) # Set a timeout for accepting new connections
-            conn, addr = s.accept()
-            with conn:
-                print(f"Connected by {addr}")
-                conn.settimeout(1) # Set timeout for receiving data from client
-                while True:
-                    try:
-                        data = conn.recv(4096) # Receive up to 4KB of data
-                        if not data:
-                            break # Client closed connection
-                        conn.sendall(data) # Echo back the received data
-                    except socket.timeout:
-                        break # No more data from client for 1 second, assume done
-                    except ConnectionResetError:
-                        print("Client disconnected unexpectedly.")
-                        break
+def run_server(transport):
+    try:
+        if transport == 'unix':
+            if os.path.exists(UNIX_SOCKET_PATH):
+                os.unlink(UNIX_SOCKET_PATH) # Stale socket file from an earlier run
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                s.bind(UNIX_SOCKET_PATH)
+                s.listen()
+                print(f"Server listening on {UNIX_SOCKET_PATH}")
+                try:
+                    echo_stream(s)
+                finally:
+                    os.unlink(UNIX_SOCKET_PATH)
+        elif transport == 'udp':
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.bind((HOST, PORT))
+                print(f"Server listening on {HOST}:{PORT} (UDP)")
+                echo_datagrams(s)
+        else:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # Allow address reuse
+                s.bind((HOST, PORT))
+                s.listen()
+                print(f"Server listening on {HOST}:{PORT}")
+                echo_stream(s)
     except socket.error as e:
         print(f"Server socket error: {e}")
     except Exception as e:
@@ -41,4 +104,7 @@ def run_server():
         sys.exit() # Ensure the server process terminates
 
 if __name__ == "__main__":
-    run_server()
+    parser = argparse.ArgumentParser(description="Loopback echo server for the network test")
+    parser.add_argument('--transport', choices=['tcp', 'udp', 'unix'], default=DEFAULT_TRANSPORT,
+                        help=f"Socket type to serve on (default: {DEFAULT_TRANSPORT})")
+    run_server(parser.parse_args().transport)
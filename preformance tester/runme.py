@@ -1,7 +1,9 @@
 import subprocess
 import re
 import os
+import sys
 import time # Needed for sleeping while server starts
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # --- Configuration ---
 # Define the names of your test scripts.
@@ -18,6 +20,58 @@ SCRIPT_REAL_GPU_TEST = "real_gputest.py" # Actual GPU test
 SCRIPT_NET_SERVER = "nettest_server.py" # Server part of network test
 SCRIPT_NET_CLIENT = "nettest_client.py" # Client part of network test
 
+# Resources each test leans on. Tests only run at the same time when their sets don't
+# overlap, so CPU-bound tests never share the machine with each other. Graphics and
+# OpenCL tests count as CPU-bound too, since they can fall back to the CPU.
+TEST_RESOURCES = {
+    SCRIPT_2D_TEST: {'gpu', 'cpu'},
+    SCRIPT_3D_TEST: {'gpu', 'cpu'},
+    SCRIPT_MC_SEEDGEN: {'cpu'},
+    SCRIPT_CPU_TEST: {'cpu'},
+    SCRIPT_MEMORY_TEST: {'mem'},
+    SCRIPT_FILE_IO_TEST: {'disk'},
+    SCRIPT_SIMULATED_GPU_TEST: {'cpu', 'mem'}, # Multithreaded BLAS
+    SCRIPT_REAL_GPU_TEST: {'gpu', 'cpu'},
+}
+MAX_CONCURRENT_TESTS = 3 # Set to 1 to run every test on its own
+
+# Interpreter for the tests. Defaults to the one running this script; set BENCH_PYTHON
+# (e.g. BENCH_PYTHON=pypy3) to run the pure-Python tests on another interpreter.
+# Tests that use NumPy, pygame, ursina or pyopencl always stay on this interpreter.
+DEFAULT_PYTHON = sys.executable or "python"
+BENCH_PYTHON = os.environ.get('BENCH_PYTHON', DEFAULT_PYTHON)
+PURE_PYTHON_SCRIPTS = {SCRIPT_MC_SEEDGEN, SCRIPT_FILE_IO_TEST, SCRIPT_NET_SERVER, SCRIPT_NET_CLIENT}
+
+# Single-threaded tests are pinned to one core each (where the OS supports affinity) so
+# the scheduler can't migrate them mid-measurement. Tests that share a core also share
+# a resource in TEST_RESOURCES, so run_tests() never runs them at the same time.
+PINNED_CORE_INDEX = {
+    SCRIPT_MC_SEEDGEN: 0,
+    SCRIPT_CPU_TEST: 0,
+    SCRIPT_MEMORY_TEST: 1,
+    SCRIPT_FILE_IO_TEST: 2,
+}
+if hasattr(os, 'sched_getaffinity'):
+    AVAILABLE_CORES = sorted(os.sched_getaffinity(0))
+else:
+    AVAILABLE_CORES = list(range(os.cpu_count() or 1))
+# With fewer cores than PINNED_CORE_INDEX needs, tests that run side by side would end
+# up sharing a core, so on such machines nothing is pinned and tests run one at a time.
+ENOUGH_CORES = len(AVAILABLE_CORES) > max(PINNED_CORE_INDEX.values())
+
+def pin_to_core(pid, script_path):
+    """Restricts a started test process to its core from PINNED_CORE_INDEX, if it has one."""
+    if not ENOUGH_CORES or script_path not in PINNED_CORE_INDEX or not hasattr(os, 'sched_setaffinity'):
+        return
+    try:
+        os.sched_setaffinity(pid, {AVAILABLE_CORES[PINNED_CORE_INDEX[script_path]]})
+    except OSError:
+        pass # Process already gone or affinity not permitted; run it unpinned
+
+def python_for(script_path):
+    """Returns the interpreter command used to run script_path."""
+    return BENCH_PYTHON if script_path in PURE_PYTHON_SCRIPTS else DEFAULT_PYTHON
+
 # --- Function to Run a Script and Capture its Output ---
 def run_script_and_capture_output(script_path, wait=True):
     """
@@ -41,24 +95,26 @@ def run_script_and_capture_output(script_path, wait=True):
 
     try:
         if wait:
-            result = subprocess.run(
-                ["python", script_path],
-                capture_output=True,
-                text=True,
-                check=False
+            process = subprocess.Popen(
+                [python_for(script_path), script_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
             )
-            if result.returncode != 0:
-                print(f"Warning: {script_path} exited with error code {result.returncode}")
-                if result.stderr:
-                    print(f"  Stderr:\n{result.stderr}")
-                if result.stdout:
-                    print(f"  Stdout (partial):\n{result.stdout[:500]}...")
-                return False, result.stdout, result.stderr
-            return True, result.stdout, result.stderr
+            pin_to_core(process.pid, script_path)
+            stdout, stderr = process.communicate()
+            if process.returncode != 0:
+                print(f"Warning: {script_path} exited with error code {process.returncode}")
+                if stderr:
+                    print(f"  Stderr:\n{stderr}")
+                if stdout:
+                    print(f"  Stdout (partial):\n{stdout[:500]}...")
+                return False, stdout, stderr
+            return True, stdout, stderr
         else:
             # Run in background (e.g., for server)
             process = subprocess.Popen(
-                ["python", script_path],
+                [python_for(script_path), script_path],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
@@ -71,144 +127,163 @@ def run_script_and_capture_output(script_path, wait=True):
         else:
             return None, None, None
 
-# --- Functions to Parse Script Outputs ---
+def run_tests(tests):
+    """
+    Runs (script_path, parser) pairs and returns their merged parsed stats.
 
-def parse_2d_output(output):
+    A test starts as soon as no running test shares a resource with it (see
+    TEST_RESOURCES), up to MAX_CONCURRENT_TESTS at once; otherwise it waits its turn.
+    Without ENOUGH_CORES the tests run one at a time.
+    """
+    max_concurrent = MAX_CONCURRENT_TESTS if ENOUGH_CORES else 1
     stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Sprites Generated:" in line:
-            match = re.search(r"Total Sprites Generated: (\d+)", line)
-            if match:
-                stats['2D Total Sprites'] = int(match.group(1))
-        elif "Lowest FPS:" in line:
-            match = re.search(r"Lowest FPS: ([\d.]+)", line)
-            if match:
-                stats['2D Lowest FPS'] = float(match.group(1))
-        elif "Highest FPS:" in line:
-            match = re.search(r"Highest FPS: ([\d.]+)", line)
-            if match:
-                stats['2D Highest FPS'] = float(match.group(1))
-        elif "Average FPS:" in line:
-            match = re.search(r"Average FPS: ([\d.]+)", line)
-            if match:
-                stats['2D Average FPS'] = float(match.group(1))
+    pending = list(tests)
+    running = {} # future -> (script_path, parser)
+    busy = set() # Resources held by running tests
+    with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
+        while pending or running:
+            for test in list(pending):
+                resources = TEST_RESOURCES.get(test[0], {'cpu'})
+                if len(running) < max_concurrent and not resources & busy:
+                    pending.remove(test)
+                    busy |= resources
+                    running[pool.submit(run_script_and_capture_output, test[0])] = test
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                script_path, parser = running.pop(future)
+                busy -= TEST_RESOURCES.get(script_path, {'cpu'})
+                success, output, error = future.result()
+                if success:
+                    stats.update(parser(output))
+                if error:
+                    print(f"Errors from {script_path}:\n{error}")
     return stats
 
+# --- Functions to Parse Script Outputs ---
+# Each table maps a stats key to (compiled pattern, converter). Patterns are compiled
+# once and searched across the whole output, rather than line by line.
+TIME_TAKEN_RE = re.compile(r"Time Taken: ([\d.]+) seconds")
+TOTAL_MATRIX_MULTS_RE = re.compile(r"Total Matrix Multiplications \(size \d+x\d+\): (\d+)")
+
+def fps_patterns(prefix):
+    return {
+        f'{prefix} Lowest FPS': (re.compile(r"Lowest FPS: ([\d.]+)"), float),
+        f'{prefix} Highest FPS': (re.compile(r"Highest FPS: ([\d.]+)"), float),
+        f'{prefix} Average FPS': (re.compile(r"Average FPS: ([\d.]+)"), float),
+    }
+
+PATTERNS_2D = {
+    '2D Total Sprites': (re.compile(r"Total Sprites Generated: (\d+)"), int),
+    **fps_patterns('2D'),
+}
+PATTERNS_3D = {
+    '3D Total Cubes': (re.compile(r"Total Cubes Generated: (\d+)"), int),
+    **fps_patterns('3D'),
+}
+PATTERNS_MC_SEEDGEN = {
+    'MC Seeds Generated': (re.compile(r"Generated (\d+) seeds in [\d.]+ seconds\."), int),
+    'MC Generation Time (s)': (re.compile(r"Generated \d+ seeds in ([\d.]+) seconds\."), float),
+}
+PATTERNS_CPU = {
+    'CPU Primes Found': (re.compile(r"Total Primes Found: (\d+)"), int),
+    'CPU Time Taken (s)': (TIME_TAKEN_RE, float),
+}
+PATTERNS_MEMORY = {
+    'Memory Allocation Cycles': (re.compile(r"Total Allocation Cycles: (\d+)"), int),
+    'Memory Time Taken (s)': (TIME_TAKEN_RE, float),
+}
+PATTERNS_FILE_IO = {
+    'File I/O Write Speed (MB/s)': (re.compile(r"Write Speed: ([\d.]+) MB/s"), float),
+    'File I/O Read Speed (MB/s)': (re.compile(r"Read Speed: ([\d.]+) MB/s"), float),
+}
+PATTERNS_SIMULATED_GPU = {
+    'Simulated GPU Matrix Multiplications': (TOTAL_MATRIX_MULTS_RE, int),
+    'Simulated GPU Time Taken (s)': (TIME_TAKEN_RE, float),
+}
+PATTERNS_REAL_GPU = {
+    'Real GPU Matrix Multiplications': (TOTAL_MATRIX_MULTS_RE, int),
+    'Real GPU Time Taken (s)': (TIME_TAKEN_RE, float),
+}
+PATTERNS_NET_CLIENT = {
+    'Net Send Speed (MB/s)': (re.compile(r"Send Speed: ([\d.]+) MB/s"), float),
+    'Net Receive Speed (MB/s)': (re.compile(r"Receive Speed: ([\d.]+) MB/s"), float),
+}
+
+def parse_output(output, patterns):
+    """Returns {stats key: converted value} for every pattern in the table found in output."""
+    return {key: convert(match.group(1)) for key, (pattern, convert) in patterns.items()
+            if (match := pattern.search(output))}
+
+def parse_2d_output(output):
+    return parse_output(output, PATTERNS_2D)
+
 def parse_3d_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Cubes Generated:" in line:
-            match = re.search(r"Total Cubes Generated: (\d+)", line)
-            if match:
-                stats['3D Total Cubes'] = int(match.group(1))
-        elif "Lowest FPS:" in line:
-            match = re.search(r"Lowest FPS: ([\d.]+)", line)
-            if match:
-                stats['3D Lowest FPS'] = float(match.group(1))
-        elif "Highest FPS:" in line:
-            match = re.search(r"Highest FPS: ([\d.]+)", line)
-            if match:
-                stats['3D Highest FPS'] = float(match.group(1))
-        elif "Average FPS:" in line:
-            match = re.search(r"Average FPS: ([\d.]+)", line)
-            if match:
-                stats['3D Average FPS'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_3D)
 
 def parse_mcseedgen_output(output):
-    stats = {}
-    match = re.search(r"Generated (\d+) seeds in ([\d.]+) seconds.", output)
-    if match:
-        stats['MC Seeds Generated'] = int(match.group(1))
-        stats['MC Generation Time (s)'] = float(match.group(2))
-    return stats
+    return parse_output(output, PATTERNS_MC_SEEDGEN)
 
 def parse_cpu_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Primes Found:" in line:
-            match = re.search(r"Total Primes Found: (\d+)", line)
-            if match:
-                stats['CPU Primes Found'] = int(match.group(1))
-        elif "Time Taken:" in line:
-            match = re.search(r"Time Taken: ([\d.]+) seconds", line)
-            if match:
-                stats['CPU Time Taken (s)'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_CPU)
 
 def parse_memory_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Allocation Cycles:" in line:
-            match = re.search(r"Total Allocation Cycles: (\d+)", line)
-            if match:
-                stats['Memory Allocation Cycles'] = int(match.group(1))
-        elif "Time Taken:" in line:
-            match = re.search(r"Time Taken: ([\d.]+) seconds", line)
-            if match:
-                stats['Memory Time Taken (s)'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_MEMORY)
 
 def parse_file_io_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Write Speed:" in line:
-            match = re.search(r"Write Speed: ([\d.]+) MB/s", line)
-            if match:
-                stats['File I/O Write Speed (MB/s)'] = float(match.group(1))
-        elif "Read Speed:" in line:
-            match = re.search(r"Read Speed: ([\d.]+) MB/s", line)
-            if match:
-                stats['File I/O Read Speed (MB/s)'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_FILE_IO)
 
 def parse_simulated_gpu_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Matrix Multiplications" in line:
-            match = re.search(r"Total Matrix Multiplications \(size \d+x\d+\): (\d+)", line)
-            if match:
-                stats['Simulated GPU Matrix Multiplications'] = int(match.group(1))
-        elif "Time Taken:" in line:
-            match = re.search(r"Time Taken: ([\d.]+) seconds", line)
-            if match:
-                stats['Simulated GPU Time Taken (s)'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_SIMULATED_GPU)
 
 def parse_real_gpu_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Total Matrix Multiplications" in line and "size" in line:
-            match = re.search(r"Total Matrix Multiplications \(size \d+x\d+\): (\d+)", line)
-            if match:
-                stats['Real GPU Matrix Multiplications'] = int(match.group(1))
-        elif "Time Taken:" in line:
-            match = re.search(r"Time Taken: ([\d.]+) seconds", line)
-            if match:
-                stats['Real GPU Time Taken (s)'] = float(match.group(1))
-    return stats
-
+    return parse_output(output, PATTERNS_REAL_GPU)
 
 def parse_net_client_output(output):
-    stats = {}
-    lines = output.split('\n')
-    for line in lines:
-        if "Send Speed:" in line:
-            match = re.search(r"Send Speed: ([\d.]+) MB/s", line)
-            if match:
-                stats['Net Send Speed (MB/s)'] = float(match.group(1))
-        elif "Receive Speed:" in line:
-            match = re.search(r"Receive Speed: ([\d.]+) MB/s", line)
-            if match:
-                stats['Net Receive Speed (MB/s)'] = float(match.group(1))
-    return stats
+    return parse_output(output, PATTERNS_NET_CLIENT)
+
+
+# --- Overview Layout ---
+# (section title, [(label, key in the collected data, format), ...]) for the final summary
+def fps_rows(prefix):
+    return [
+        ("Lowest FPS", f"{prefix} Lowest FPS", "{:.2f}"),
+        ("Highest FPS", f"{prefix} Highest FPS", "{:.2f}"),
+        ("Average FPS", f"{prefix} Average FPS", "{:.2f}"),
+    ]
+
+OVERVIEW_SECTIONS = [
+    ("2D Pygame Test (Graphics)", [("Total Sprites", "2D Total Sprites", "{}"), *fps_rows("2D")]),
+    ("3D Ursina Test (Graphics)", [("Total Cubes", "3D Total Cubes", "{}"), *fps_rows("3D")]),
+    ("Minecraft Seed Gen Test (Light CPU)", [
+        ("Seeds Generated", "MC Seeds Generated", "{}"),
+        ("Generation Time", "MC Generation Time (s)", "{:.2f} seconds"),
+    ]),
+    ("CPU Performance Test (Heavy CPU)", [
+        ("Primes Found", "CPU Primes Found", "{}"),
+        ("Time Taken", "CPU Time Taken (s)", "{:.2f} seconds"),
+    ]),
+    ("Memory Performance Test", [
+        ("Allocation Cycles", "Memory Allocation Cycles", "{}"),
+        ("Time Taken", "Memory Time Taken (s)", "{:.2f} seconds"),
+    ]),
+    ("File I/O Performance Test", [
+        ("Write Speed", "File I/O Write Speed (MB/s)", "{:.2f} MB/s"),
+        ("Read Speed", "File I/O Read Speed (MB/s)", "{:.2f} MB/s"),
+    ]),
+    ("Simulated GPU Compute Test (CPU-based)", [
+        ("Matrix Multiplications", "Simulated GPU Matrix Multiplications", "{}"),
+        ("Time Taken", "Simulated GPU Time Taken (s)", "{:.2f} seconds"),
+    ]),
+    ("Actual GPU Compute Test (OpenCL)", [
+        ("Matrix Multiplications", "Real GPU Matrix Multiplications", "{}"),
+        ("Time Taken", "Real GPU Time Taken (s)", "{:.2f} seconds"),
+    ]),
+    ("Network Performance Test (Loopback)", [
+        ("Send Speed", "Net Send Speed (MB/s)", "{:.2f} MB/s"),
+        ("Receive Speed", "Net Receive Speed (MB/s)", "{:.2f} MB/s"),
+    ]),
+]
 
 
 # --- Main Orchestration Logic ---
@@ -217,61 +292,17 @@ def main():
     net_server_process = None
 
     try:
-        # Run 2D Pygame Test
-        success_2d, output_2d, error_2d = run_script_and_capture_output(SCRIPT_2D_TEST)
-        if success_2d:
-            all_performance_data.update(parse_2d_output(output_2d))
-        if error_2d:
-            print(f"Errors from {SCRIPT_2D_TEST}:\n{error_2d}")
-
-        # Run 3D Ursina Test
-        success_3d, output_3d, error_3d = run_script_and_capture_output(SCRIPT_3D_TEST)
-        if success_3d:
-            all_performance_data.update(parse_3d_output(output_3d))
-        if error_3d:
-            print(f"Errors from {SCRIPT_3D_TEST}:\n{error_3d}")
-
-        # Run Minecraft Seed Generator
-        success_mc, output_mc, error_mc = run_script_and_capture_output(SCRIPT_MC_SEEDGEN)
-        if success_mc:
-            all_performance_data.update(parse_mcseedgen_output(output_mc))
-        if error_mc:
-            print(f"Errors from {SCRIPT_MC_SEEDGEN}:\n{error_mc}")
-
-        # Run CPU Performance Test
-        success_cpu, output_cpu, error_cpu = run_script_and_capture_output(SCRIPT_CPU_TEST)
-        if success_cpu:
-            all_performance_data.update(parse_cpu_output(output_cpu))
-        if error_cpu:
-            print(f"Errors from {SCRIPT_CPU_TEST}:\n{error_cpu}")
-
-        # Run Memory Performance Test
-        success_mem, output_mem, error_mem = run_script_and_capture_output(SCRIPT_MEMORY_TEST)
-        if success_mem:
-            all_performance_data.update(parse_memory_output(output_mem))
-        if error_mem:
-            print(f"Errors from {SCRIPT_MEMORY_TEST}:\n{error_mem}")
-
-        # Run File I/O Performance Test
-        success_fileio, output_fileio, error_fileio = run_script_and_capture_output(SCRIPT_FILE_IO_TEST)
-        if success_fileio:
-            all_performance_data.update(parse_file_io_output(output_fileio))
-        if error_fileio:
-            print(f"Errors from {SCRIPT_FILE_IO_TEST}:\n{error_fileio}")
-
-        # Run Simulated GPU Compute Test
-        success_sim_gpu, output_sim_gpu, error_sim_gpu = run_script_and_capture_output(SCRIPT_SIMULATED_GPU_TEST)
-        if success_sim_gpu:
-            all_performance_data.update(parse_simulated_gpu_output(output_sim_gpu))
-        if error_sim_gpu:
-            print(f"Errors from {SCRIPT_SIMULATED_GPU_TEST}:\n{error_sim_gpu}")
-
-        # Run Actual GPU Compute Test
-        success_real_gpu, output_real_gpu, error_real_gpu = run_script_and_capture_output(SCRIPT_REAL_GPU_TEST)
-        if success_real_gpu:
-            all_performance_data.update(parse_real_gpu_output(output_real_gpu))
-        if error_real_gpu:
-            print(f"Errors from {SCRIPT_REAL_GPU_TEST}:\n{error_real_gpu}")
+        # Run every test except the network pair, overlapping the ones that don't compete
+        all_performance_data.update(run_tests([
+            (SCRIPT_2D_TEST, parse_2d_output),
+            (SCRIPT_3D_TEST, parse_3d_output),
+            (SCRIPT_MC_SEEDGEN, parse_mcseedgen_output),
+            (SCRIPT_CPU_TEST, parse_cpu_output),
+            (SCRIPT_MEMORY_TEST, parse_memory_output),
+            (SCRIPT_FILE_IO_TEST, parse_file_io_output),
+            (SCRIPT_SIMULATED_GPU_TEST, parse_simulated_gpu_output),
+            (SCRIPT_REAL_GPU_TEST, parse_real_gpu_output),
+        ]))
 
         # --- Network Performance Test (Special Handling) ---
         print("\n--- Starting Network Performance Test ---")
@@ -321,56 +352,14 @@ def main():
         print("No performance data collected from any scripts.")
         return
 
-    # Print collected data in a formatted way
-    if '2D Total Sprites' in all_performance_data:
-        print("\n--- 2D Pygame Test (Graphics) ---")
-        print(f"  Total Sprites: {all_performance_data.get('2D Total Sprites', 'N/A')}")
-        print(f"  Lowest FPS: {all_performance_data.get('2D Lowest FPS', 'N/A'):.2f}")
-        print(f"  Highest FPS: {all_performance_data.get('2D Highest FPS', 'N/A'):.2f}")
-        print(f"  Average FPS: {all_performance_data.get('2D Average FPS', 'N/A'):.2f}")
-
-    if '3D Total Cubes' in all_performance_data:
-        print("\n--- 3D Ursina Test (Graphics) ---")
-        print(f"  Total Cubes: {all_performance_data.get('3D Total Cubes', 'N/A')}")
-        print(f"  Lowest FPS: {all_performance_data.get('3D Lowest FPS', 'N/A'):.2f}")
-        print(f"  Highest FPS: {all_performance_data.get('3D Highest FPS', 'N/A'):.2f}")
-        print(f"  Average FPS: {all_performance_data.get('3D Average FPS', 'N/A'):.2f}")
-
-    if 'MC Seeds Generated' in all_performance_data:
-        print("\n--- Minecraft Seed Gen Test (Light CPU) ---")
-        print(f"  Seeds Generated: {all_performance_data.get('MC Seeds Generated', 'N/A')}")
-        print(f"  Generation Time: {all_performance_data.get('MC Generation Time (s)', 'N/A'):.2f} seconds")
-
-    if 'CPU Primes Found' in all_performance_data:
-        print("\n--- CPU Performance Test (Heavy CPU) ---")
-        print(f"  Primes Found: {all_performance_data.get('CPU Primes Found', 'N/A')}")
-        print(f"  Time Taken: {all_performance_data.get('CPU Time Taken (s)', 'N/A'):.2f} seconds")
-
-    if 'Memory Allocation Cycles' in all_performance_data:
-        print("\n--- Memory Performance Test ---")
-        print(f"  Allocation Cycles: {all_performance_data.get('Memory Allocation Cycles', 'N/A')}")
-        print(f"  Time Taken: {all_performance_data.get('Memory Time Taken (s)', 'N/A'):.2f} seconds")
-
-    if 'File I/O Write Speed (MB/s)' in all_performance_data:
-        print("\n--- File I/O Performance Test ---")
-        print(f"  Write Speed: {all_performance_data.get('File I/O Write Speed (MB/s)', 'N/A'):.2f} MB/s")
-        print(f"  Read Speed: {all_performance_data.get('File I/O Read Speed (MB/s)', 'N/A'):.2f} MB/s")
-
-    if 'Simulated GPU Matrix Multiplications' in all_performance_data:
-        print("\n--- Simulated GPU Compute Test (CPU-based) ---")
-        print(f"  Matrix Multiplications: {all_performance_data.get('Simulated GPU Matrix Multiplications', 'N/A')}")
-        print(f"  Time Taken: {all_performance_data.get('Simulated GPU Time Taken (s)', 'N/A'):.2f} seconds")
-
-    if 'Real GPU Matrix Multiplications' in all_performance_data:
-        print("\n--- Actual GPU Compute Test (OpenCL) ---")
-        print(f"  Matrix Multiplications: {all_performance_data.get('Real GPU Matrix Multiplications', 'N/A')}")
-        print(f"  Time Taken: {all_performance_data.get('Real GPU Time Taken (s)', 'N/A'):.2f} seconds")
-
-    if 'Net Send Speed (MB/s)' in all_performance_data:
-        print("\n--- Network Performance Test (Loopback) ---")
-        print(f"  Send Speed: {all_performance_data.get('Net Send Speed (MB/s)', 'N/A'):.2f} MB/s")
-        print(f"  Receive Speed: {all_performance_data.get('Net Receive Speed (MB/s)', 'N/A'):.2f} MB/s")
-
+    # Print collected data in a formatted way; a section is shown when its first key was parsed
+    for title, rows in OVERVIEW_SECTIONS:
+        if rows[0][1] not in all_performance_data:
+            continue
+        print(f"\n--- {title} ---")
+        for label, key, fmt in rows:
+            value = all_performance_data.get(key)
+            print(f"  {label}: {'N/A' if value is None else fmt.format(value)}")
 
     print("\n" + "="*30)
 
@@ -1,83 +1,172 @@
 import subprocess
 import os
-from tkinter import Tk, filedialog, messagebox
+import sys
 import random
+import atexit
+import shutil
+import time
+import tempfile
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+# Absolute path to ffmpeg, looked up once; None when it isn't installed
+FFMPEG = shutil.which('ffmpeg')
+FFPROBE = shutil.which('ffprobe') # Optional; only used to specialize the command
+LOG_TAIL_BYTES = 64 * 1024 # How much of ffmpeg's log to keep for error messages
+FFMPEG_MISSING = "Error: FFmpeg not found. Please ensure it is installed and in your system's PATH."
+
+# Hardware H.264 encoders in order of preference, with the options that replace
+# libx264's. The noise/unsharp/eq filters only exist on the CPU, so frames are
+# filtered in system memory either way and only VAAPI needs an explicit upload.
+HW_ENCODERS = {
+    'h264_nvenc': {
+        'input_args': [],
+        'filter_suffix': '',
+        'video_args': ['-preset', 'p1', '-tune', 'll', '-rc', 'cbr', '-b:v', '32k',
+                       '-profile:v', 'baseline', '-pix_fmt', 'yuv420p'],
+    },
+    'h264_vaapi': {
+        'input_args': ['-vaapi_device', '/dev/dri/renderD128'],
+        'filter_suffix': ',format=nv12,hwupload',
+        'video_args': ['-rc_mode', 'CBR', '-b:v', '32k', '-profile:v', 'constrained_baseline'],
+    },
+    'h264_qsv': {
+        'input_args': [],
+        'filter_suffix': '',
+        'video_args': ['-preset', 'veryfast', '-b:v', '32k', '-profile:v', 'baseline',
+                       '-pix_fmt', 'nv12'],
+    },
+}
+SOFTWARE_ENCODER = {
+    'input_args': [],
+    'filter_suffix': '',
+    # Every frame is a keyframe (-g 1), so x264's lookahead and B-frame search
+    # only add latency; zerolatency and the params below switch them off.
+    'video_args': ['-crf', '51', '-preset', 'ultrafast', '-tune', 'zerolatency,fastdecode',
+                   '-x264-params', 'rc-lookahead=0:sync-lookahead=0:bframes=0:ref=1:sliced-threads=0',
+                   '-profile:v', 'baseline', '-level', '3.0', '-pix_fmt', 'yuv420p'],
+}
+
+# Seed for both noise filters, so the same input always gets destroyed the same way
+NOISE_SEED = 123457
+
+# The destruction filter chain, split into its three stages. A level-N output runs
+# the first N stages; the full destruction is level 3.
+DESTRUCTION_STAGES = [
+    # Stage 1: extreme downscaling and bit crushing
+    ['scale=64:36', f'noise=alls=20:allf=t+u:all_seed={NOISE_SEED}', 'fps=5'],
+    # Stage 2: visual artifacts and distortions
+    ['scale=32:18', 'scale=160:90:flags=neighbor', 'unsharp=5:5:-2.0:5:5:-2.0',
+     'eq=contrast=2:brightness=0.2'],
+    # Stage 3: final destruction with maximum artifacts
+    ['scale=80:45', 'scale=160:90:flags=neighbor', f'noise=alls=50:allf=t+u:all_seed={NOISE_SEED}'],
+]
+MAX_DESTRUCTION_LEVEL = len(DESTRUCTION_STAGES)
+# Inputs this small and slow are already past the downscaling that stage 1 does
+TINY_INPUT_MAX = (160, 90, 5) # width, height, fps
+
+@lru_cache(maxsize=None)
+def detect_hw_encoder():
+    """Returns the name of the first working hardware H.264 encoder, or 'libx264'."""
+    if FFMPEG is None:
+        return 'libx264'
+    encoders = subprocess.run([FFMPEG, '-hide_banner', '-encoders'],
+                              capture_output=True, text=True).stdout
+
+    for name, settings in HW_ENCODERS.items():
+        if name not in encoders:
+            continue
+        # Being compiled in doesn't mean the GPU/driver is there, so try a tiny encode
+        probe = [
+            FFMPEG, '-hide_banner', '-v', 'error', *settings['input_args'],
+            '-f', 'lavfi', '-i', 'color=size=160x90:rate=3:duration=1',
+            '-vf', 'null' + settings['filter_suffix'],
+            '-c:v', name, *settings['video_args'], '-f', 'null', '-'
+        ]
+        if subprocess.run(probe, capture_output=True).returncode == 0:
+            return name
+    return 'libx264'
+
+def has_display():
+    """True when a GUI popup can be shown (Windows/macOS, or an X11/Wayland session)."""
+    return (sys.platform in ('win32', 'darwin')
+            or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')))
+
+root = None # Hidden Tk root shared by every dialog; created on first use
+
+def get_root():
+    """Returns the process-wide hidden Tk root, creating it the first time."""
+    global root
+    if root is None:
+        # tkinter is imported here so non-GUI runs never load Tcl/Tk
+        from tkinter import Tk
+        root = Tk()
+        root.withdraw()
+        atexit.register(root.destroy)
+    return root
 
 def select_video_file():
     """Opens a file dialog to allow the user to select a video file."""
-    root = Tk()
-    root.withdraw()  
+    from tkinter import filedialog
+    get_root()
     file_path = filedialog.askopenfilename(
         title="Select a video file to destroy",
         filetypes=(("Video files", "*.mp4 *.avi *.mov *.mkv *.flv *.wmv"), ("All files", "*.*"))
     )
     return file_path
 
-def destroy_video_quality(input_file, output_file):
+def probe_video(input_file):
     """
-    Destroys a video's quality beyond recognition using extreme FFmpeg settings.
-    This creates an intentionally unwatchable, heavily degraded output.
+    Returns (width, height, fps, duration) of the first video stream using a single
+    ffprobe call, or None when ffprobe is missing or can't read the file.
+    duration is None when the container doesn't report one.
     """
-    if not input_file:
-        print("No file selected. Exiting.")
-        return
-
+    if FFPROBE is None:
+        return None
+    result = subprocess.run(
+        [FFPROBE, '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=width,height,r_frame_rate:format=duration',
+         '-of', 'default=noprint_wrappers=1', input_file],
+        capture_output=True, text=True)
+    info = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
     try:
+        num, _, den = info['r_frame_rate'].partition('/')
+        fps = float(num) / float(den or 1)
+        width, height = int(info['width']), int(info['height'])
+    except (KeyError, ValueError, ZeroDivisionError):
+        return None
+    try:
+        duration = float(info.get('duration', ''))
+    except ValueError:
+        duration = None
+    return width, height, fps, duration
 
-        temp_file1 = "temp_destroyed_1.mp4"
-        temp_file2 = "temp_destroyed_2.mp4"
-
-        command1 = [
-            'ffmpeg', '-y',  
-            '-i', input_file,
-            '-vf', 'scale=64:36,noise=alls=20:allf=t+u',  
-            '-c:v', 'libx264',
-            '-crf', '51',  
-            '-preset', 'ultrafast',
-            '-r', '5',  
-            '-pix_fmt', 'yuv420p',
-            '-c:a', 'aac',  
-            '-ar', '22050',  
-            '-b:a', '16k',   
-            '-ac', '1',     
-            '-strict', '-2',  
-            temp_file1
-        ]
-
-        print("Pass 1: Extreme downscaling and bit crushing...")
-        subprocess.run(command1, check=True, capture_output=True)
-
-        command2 = [
-            'ffmpeg', '-y',
-            '-i', temp_file1,
-            '-vf', 'scale=32:18,scale=160:90:flags=neighbor,unsharp=5:5:-2.0:5:5:-2.0,eq=contrast=2:brightness=0.2',
-            '-c:v', 'libx264',
-            '-crf', '51',
-            '-preset', 'ultrafast',
-            '-maxrate', '50k',  
-            '-bufsize', '25k',
-            '-g', '1',  
-            '-c:a', 'aac',
-            '-ar', '22050',
-            '-b:a', '12k',  
-            '-ac', '1',
-            '-strict', '-2',
-            temp_file2
-        ]
+def build_command(input_file, outputs, first_stage=0):
+    """
+    Builds one ffmpeg command that decodes input_file once and writes every
+    (output_file, level) pair in outputs, each through its own encoder.
+    first_stage skips that many leading destruction stages for every output.
+    """
+    if FFMPEG is None:
+        raise FileNotFoundError('ffmpeg')
+    encoder = detect_hw_encoder()
+    settings = HW_ENCODERS.get(encoder, SOFTWARE_ENCODER)
 
-        print("Pass 2: Adding visual artifacts and distortions")
-        subprocess.run(command2, check=True, capture_output=True)
-
-        command3 = [
-            'ffmpeg', '-y',
-            '-i', temp_file2,
-            '-vf', f'scale=80:45,scale=160:90:flags=neighbor,noise=alls=50:allf=t+u',
-            '-c:v', 'libx264',
-            '-crf', '51',
-            '-preset', 'ultrafast',
-            '-tune', 'fastdecode',
-            '-profile:v', 'baseline',
-            '-level', '3.0',
+    command = [
+        FFMPEG, '-y', '-nostats',
+        # Machine-readable progress on stdout instead of the stderr log
+        '-progress', 'pipe:1',
+        *settings['input_args'],
+        # Decode on the GPU when possible; frames are downloaded for the CPU filters
+        '-hwaccel', 'auto',
+        '-i', input_file,
+    ]
+    for output_file, level in outputs:
+        video_filters = ','.join(f for stage in DESTRUCTION_STAGES[first_stage:level] for f in stage)
+        command += [
+            '-vf', video_filters + settings['filter_suffix'],
+            '-c:v', encoder,
+            *settings['video_args'],
             '-maxrate', '32k',
             '-bufsize', '16k',
             '-r', '3',  
@@ -91,20 +180,76 @@ def destroy_video_quality(input_file, output_file):
             '-strict', '-2',
             output_file
         ]
+    return command
 
-        print("Pass 3: Final destruction with maximum artifacts...")
-        subprocess.run(command3, check=True, capture_output=True)
+def report_progress(process, show_progress, duration):
+    """Reads ffmpeg's -progress lines until it exits, printing them if show_progress."""
+    start_time = time.monotonic()
+    for line in process.stdout:
+        # Despite the name, out_time_ms is in microseconds
+        if show_progress and line.startswith('out_time_ms=') and line[12:].strip().isdigit():
+            done = int(line[12:]) / 1_000_000
+            if duration and done > 0:
+                eta = (time.monotonic() - start_time) * (duration - done) / done
+                print(f"\r  Destroyed {done:.1f}s of {duration:.1f}s "
+                      f"({min(done / duration, 1):.0%}), ~{max(eta, 0):.0f}s left  ", end='', flush=True)
+            else:
+                print(f"\r  Destroyed {done:.1f}s of video", end='', flush=True)
+    process.wait()
+    if show_progress:
+        print()
 
-        for temp_file in [temp_file1, temp_file2]:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+def run_ffmpeg(command, show_progress=True, duration=None):
+    """
+    Runs an ffmpeg command, printing progress (with an ETA when the input duration
+    is known); raises CalledProcessError with the end of ffmpeg's log on failure.
+    """
+    with tempfile.TemporaryFile() as log:
+        # The log goes to an anonymous temp file instead of memory; it is only read on failure
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=log, text=True)
+        report_progress(process, show_progress, duration)
+        if process.returncode != 0:
+            log.seek(max(log.seek(0, os.SEEK_END) - LOG_TAIL_BYTES, 0))
+            raise subprocess.CalledProcessError(process.returncode, command, stderr=log.read())
+
+def destroy_video_quality(input_file, output_file, show_gui=True, show_progress=True):
+    """
+    Destroys a video's quality beyond recognition using extreme FFmpeg settings.
+    This creates an intentionally unwatchable, heavily degraded output.
+    Pass show_gui=False to skip the success popup and show_progress=False to skip
+    the live progress line (e.g. from worker processes).
+    """
+    if not input_file:
+        print("No file selected. Exiting.")
+        return
+
+    try:
+
+        probe = probe_video(input_file)
+        duration = probe[3] if probe else None
+        first_stage = 0
+        if probe and all(value <= limit for value, limit in zip(probe, TINY_INPUT_MAX)):
+            # Already tiny: stage 1 exists to cut resolution and frame rate, which this
+            # input already lacks. Stages 2 and 3 still do the visible destruction.
+            first_stage = 1
+            print("Input is already 160x90 @ 5fps or less, skipping the downscaling stage.")
+
+        # All destruction stages run as one filter chain in a single ffmpeg
+        # process, so the video is decoded and encoded once with no temp files.
+        command = build_command(input_file, [(output_file, MAX_DESTRUCTION_LEVEL)], first_stage)
+
+        print(f"Destroying: downscaling, bit crushing, artifacts and noise in a single pass ({detect_hw_encoder()})...")
+        run_ffmpeg(command, show_progress, duration)
 
         print(f"\n🎉 Successfully Destroyed '{input_file}' into unwatchable '{output_file}'!")
         print("Video specs: 160x90 @ 3fps, ~32kbps video, 8kbps mono audio")
         print("Quality level: Potato")
 
-        root = Tk()
-        root.withdraw()
+        if not show_gui or not has_display():
+            return
+
+        from tkinter import messagebox
+        get_root()
         messagebox.showinfo("Video Destroyed", 
                           f"Your video has been successfully destroyed\n\n"
                           f"Output: {output_file}\n"
@@ -112,15 +257,53 @@ def destroy_video_quality(input_file, output_file):
                           f"Quality level: Unwatchable")
 
     except subprocess.CalledProcessError as e:
-        print(f"Error during video destruction:\n{e.stderr.decode()}")
+        print(f"Error during video destruction:\n{e.stderr.decode(errors='replace')}")
+    except FileNotFoundError:
+        print(FFMPEG_MISSING)
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
+def destroy_video_variants(input_file, variants, show_progress=True):
+    """
+    Writes several destruction levels of one video in a single ffmpeg run, e.g.
+    {'mild.mp4': 1, 'bad.mp4': 2, 'potato.mp4': 3}. The input is demuxed and
+    decoded once and the decoded frames feed every output.
+    """
+    if not input_file:
+        print("No file selected. Exiting.")
+        return
+
+    try:
+        for level in variants.values():
+            if not 1 <= level <= MAX_DESTRUCTION_LEVEL:
+                raise ValueError(f"destruction level must be 1-{MAX_DESTRUCTION_LEVEL}, got {level}")
+
+        command = build_command(input_file, variants.items())
+        probe = probe_video(input_file)
+
+        print(f"Destroying into {len(variants)} variants from a single decode ({detect_hw_encoder()})...")
+        run_ffmpeg(command, show_progress, probe[3] if probe else None)
+
+        for output_file, level in variants.items():
+            print(f"🎉 Level {level} destruction written to '{output_file}'")
+
+    except subprocess.CalledProcessError as e:
+        print(f"Error during video destruction:\n{e.stderr.decode(errors='replace')}")
     except FileNotFoundError:
-        print("Error: FFmpeg not found. Please ensure it is installed and in your system's PATH.")
+        print(FFMPEG_MISSING)
     except Exception as e:
         print(f"Unexpected error: {e}")
 
+def destroy_one(input_file):
+    """Batch worker: destroys one video into DESTROYED_<name>.mp4 without any popups."""
+    filename = os.path.splitext(os.path.basename(input_file))[0]
+    output_file = f"DESTROYED_{filename}.mp4"
+    print(f"\n--- Destroying video: {os.path.basename(input_file)} ---")
+    destroy_video_quality(input_file, output_file, show_gui=False, show_progress=False)
+
 def batch_destroy_videos():
-    root = Tk()
-    root.withdraw()
+    from tkinter import filedialog, messagebox
+    get_root()
 
     file_paths = filedialog.askopenfilenames(
         title="Select video files to destroy (hold Ctrl for multiple)",
@@ -128,13 +311,22 @@ def batch_destroy_videos():
     )
 
     if file_paths:
-        for i, input_file in enumerate(file_paths):
-            filename = os.path.splitext(os.path.basename(input_file))[0]
-            output_file = f"DESTROYED_{filename}.mp4"
-            print(f"\n--- Destroying video {i+1}/{len(file_paths)}: {os.path.basename(input_file)} ---")
-            destroy_video_quality(input_file, output_file)
+        # One ffmpeg per worker; a single 160x90 encode doesn't come close to
+        # using every core, so several videos are destroyed at once.
+        max_workers = min(len(file_paths), max(1, (os.cpu_count() or 2) // 2))
+        print(f"Destroying {len(file_paths)} videos with {max_workers} workers...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(destroy_one, file_paths))
+
+        # Workers never open Tk; the parent shows one popup for the whole batch
+        messagebox.showinfo("Videos Destroyed",
+                            f"{len(file_paths)} videos have been successfully destroyed")
 
 if __name__ == "__main__":
+    if FFMPEG is None:
+        # Fail before any file dialogs rather than after the user has picked videos
+        sys.exit(FFMPEG_MISSING)
+
     print("My video looks too good you say, this fixes that")
     print("=" * 50)
     print("This script will make your videos completely unwatchable")